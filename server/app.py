@@ -1,5 +1,6 @@
 """FastAPI application for Databricks App Template."""
 
+import logging
 import os
 from pathlib import Path
 
@@ -34,6 +35,12 @@ def load_env_file(filepath: str) -> None:
 load_env_file('.env')
 load_env_file('.env.local')
 
+# Configure logging once for the whole process (set LOG_LEVEL=DEBUG for verbose tool logs)
+logging.basicConfig(
+  level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+  format='%(asctime)s %(levelname)s [%(name)s] %(message)s',
+)
+
 
 # Load configuration from config.yaml
 def load_config() -> dict:
@@ -8,6 +8,8 @@ from databricks.sdk import WorkspaceClient
 from databricks.sdk.core import Config
 from databricks.sdk.service.sql import StatementState
 
+from server.tools import _clear_registry_cache
+
 router = APIRouter()
 
 
@@ -280,6 +282,9 @@ async def update_api(
                 detail=f'Update failed: {statement.status.state}'
             )
 
+        # The MCP tools cache registry rows; the row (and possibly its api_name) just changed
+        _clear_registry_cache(catalog, schema)
+
         return {"message": "API updated successfully"}
 
     except Exception as e:
@@ -361,6 +366,9 @@ async def delete_api(
                 detail=f'Delete from registry failed: {delete_statement.status.state}'
             )
 
+        # Stop the MCP tools serving the deleted row from their registry cache
+        _clear_registry_cache(catalog, schema)
+
         # Step 3: Drop the HTTP connection if we found one
         if connection_name:
             # Use simple DROP syntax and pass catalog/schema as parameters
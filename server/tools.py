@@ -1,18 +1,234 @@
 """MCP Tools for Databricks operations with Unity Catalog HTTP Connections."""
 
+import asyncio
+import functools
+import hashlib
 import json
+import logging
+import math
 import os
+import re
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import ContextVar, copy_context
 from datetime import datetime, timezone
-from typing import Dict
-from urllib.parse import urlparse
+from string import Template
+from types import MappingProxyType
+from typing import Literal, get_args
 
+import requests
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.core import Config
 from databricks.sdk.service.catalog import ConnectionType
 from databricks.sdk.service.serving import ExternalFunctionRequestHttpMethod
+from databricks.sdk.service.sql import StatementParameterListItem, StatementResponse, StatementState
 from fastmcp.server.dependencies import get_http_headers
-from contextvars import ContextVar
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+
+# Deployment configuration. Read on use, not at import: server.app imports this module
+# before it loads .env / .env.local into os.environ.
+def _databricks_host() -> str | None:
+  return os.environ.get('DATABRICKS_HOST')
+
+
+def _default_warehouse() -> str | None:
+  return os.environ.get('DATABRICKS_SQL_WAREHOUSE_ID')
+
+
+def _api_key_scope() -> str:
+  return os.environ.get('MCP_API_KEY_SCOPE', 'mcp_api_keys')
+
+
+def _bearer_scope() -> str:
+  return os.environ.get('MCP_BEARER_TOKEN_SCOPE', 'mcp_bearer_tokens')
+
+
+# register_api's auth_type is typed with this Literal, so FastMCP's argument validation
+# rejects anything else before the tool body runs
+_AuthType = Literal['none', 'api_key', 'bearer_token']
+_VALID_AUTH_TYPES: frozenset[str] = frozenset(get_args(_AuthType))
+_SECRET_AUTH_TYPES: frozenset[str] = frozenset({'api_key', 'bearer_token'})
+
+# register_apis_bulk entries: required fields, every accepted field, and the batch-level
+# arguments that are ignored when repeated in an entry
+_BULK_API_REQUIRED = ('api_name', 'description', 'host', 'auth_type')
+_BULK_API_FIELDS: frozenset[str] = frozenset({
+  *_BULK_API_REQUIRED, 'base_path', 'available_endpoints', 'example_calls',
+  'documentation_url', 'port',
+})
+_BULK_API_BATCH_FIELDS: frozenset[str] = frozenset({'warehouse_id', 'catalog', 'schema'})
+
+_HTTP_METHOD_MAP = MappingProxyType({
+  'GET': ExternalFunctionRequestHttpMethod.GET,
+  'POST': ExternalFunctionRequestHttpMethod.POST,
+  'PUT': ExternalFunctionRequestHttpMethod.PUT,
+  'DELETE': ExternalFunctionRequestHttpMethod.DELETE,
+  'PATCH': ExternalFunctionRequestHttpMethod.PATCH,
+})
+
+# Methods execute_api_call may send in the same statement as its registry lookup. The fused
+# request can reach the wrong connection and be sent again, so only GET qualifies (HEAD is
+# the other safe method, but http_request() does not support it).
+_FUSED_CALL_METHODS: frozenset[str] = frozenset({'GET'})
+
+# execute_api_call error messages by upstream status code (str.format templates)
+_HTTP_ERROR_MESSAGES = MappingProxyType({
+  401: (
+    '401 Unauthorized - Authentication failed. '
+    "Check your bearer token/API key in secret scope '{secret_scope}'"
+  ),
+  403: '403 Forbidden - Access denied. Check your credentials and permissions.',
+  404: "404 Not Found - The path '{path}' does not exist on this API",
+})
+_HTTP_ERROR_DEFAULT = 'HTTP {status_code} Error - API request failed'
+
+# http_request() call with every argument bound as a named parameter, so the statement text is
+# identical across calls. params/headers are JSON objects (or NULL) bound as strings.
+_HTTP_REQUEST_SQL = """http_request(
+  conn => :conn,
+  method => :method,
+  path => :path,
+  params => from_json(:params, 'MAP<STRING, STRING>'),
+  headers => from_json(:headers, 'MAP<STRING, STRING>')
+)"""
+
+# http_request() for api_key APIs: the key is read with secret() and merged into the params map
+_HTTP_REQUEST_APIKEY_SQL = """http_request(
+  conn => :conn,
+  method => :method,
+  path => :path,
+  params => map_concat(
+    map('api_key', secret(:secret_scope, :secret_key)),
+    from_json(:params, 'MAP<STRING, STRING>')
+  ),
+  headers => from_json(:headers, 'MAP<STRING, STRING>')
+)"""
+
+# call_parameterized_api always asks for JSON
+_ACCEPT_JSON_HEADERS = json.dumps({'Accept': 'application/json'})
+
+# API name -> connection name identifier (spaces become underscores)
+_CONN_NAME_TRANS = str.maketrans({' ': '_'})
+
+# Doubles single quotes for SQL string literals that cannot be bound as parameters (DDL)
+_SQL_QUOTE_TABLE = str.maketrans({"'": "''"})
+
+# Matches http_request( calls case-insensitively without lowercasing a copy of the query
+_HTTP_REQUEST_RE = re.compile(r'http_request\s*\(', re.IGNORECASE)
+
+# API documentation scanning: full URLs, endpoint-looking paths, and code blocks
+_URL_RE = re.compile(r'https?://[^\s<>"\']+(?:/[^\s<>"\']*)?')
+_PATH_RE = re.compile(r'/api/[^\s<>"\']+|/v\d+/[^\s<>"\']+|/[a-z_]+/[a-z_]+')
+_CODE_RE = re.compile(r'<code>(.*?)</code>|<pre>(.*?)</pre>|```(.*?)```', re.DOTALL)
+# Documentation pages are read up to this many bytes; the scans only keep a preview and the
+# first few matches, which come from the top of the page
+_DOC_MAX_BYTES = 512_000
+
+# Common API parameter names, matched as case-insensitive substrings in one pass
+_DOC_PARAM_NAMES = ('apikey', 'api_key', 'token', 'function', 'symbol', 'query')
+_PARAM_RE = re.compile('|'.join(map(re.escape, _DOC_PARAM_NAMES)), re.IGNORECASE)
+
+# Guidance attached to every successful check_api_http_registry result
+_IMPORTANT_READ_THIS = (
+  "⚠️ BEFORE calling execute_api_call, CHECK the 'available_endpoints' field for each API. "
+  'This tells you which paths are documented to exist. '
+  "DO NOT guess or assume paths - use only what's listed!"
+)
+
+# CREATE CONNECTION statements, one per auth flavor; only the values are substituted per call
+_TMPL_PUBLIC = Template("""CREATE CONNECTION $connection_name
+  TYPE HTTP
+  OPTIONS (
+    host '$host',
+    port '$port'$base_path_clause,
+    bearer_token ''
+  )
+  COMMENT '$comment';""")
+_TMPL_APIKEY = _TMPL_PUBLIC  # API keys are sent as a runtime param, not stored on the connection
+_TMPL_BEARER = Template("""CREATE CONNECTION $connection_name
+  TYPE HTTP
+  OPTIONS (
+    host '$host',
+    port '$port'$base_path_clause,
+    bearer_token secret('$scope', '$secret_key')
+  )
+  COMMENT '$comment';""")
+_CONNECTION_SQL_TEMPLATES = {
+  'none': _TMPL_PUBLIC,
+  'api_key': _TMPL_APIKEY,
+  'bearer_token': _TMPL_BEARER,
+}
+
+# Registry INSERT for existing connections; row values are bound as named parameters
+_TMPL_CONNECTION_REGISTRY_INSERT = Template("""INSERT INTO $table_name
+(api_id, api_name, description, connection_name, api_path,
+ http_method, request_headers, documentation_url, parameters,
+ status, validation_message, user_who_requested, created_at, modified_date)
+VALUES (
+  :api_id, :api_name, :description, :connection_name, :api_path,
+  :http_method, :request_headers, :documentation_url, :parameters,
+  :status, :validation_message, :user_who_requested,
+  CAST(:now AS TIMESTAMP), CAST(:now AS TIMESTAMP)
+)""")
+
+# Registry upsert keyed on api_name. :rows is a JSON array of row objects, so one statement
+# (and one Delta commit) writes any number of APIs; re-registering an api_name replaces its row.
+_REGISTRY_MERGE_SQL = Template("""MERGE INTO $table_name AS t
+USING (
+  SELECT inline(from_json(:rows, 'ARRAY<STRUCT<
+    api_id: STRING, api_name: STRING, description: STRING, connection_name: STRING,
+    host: STRING, base_path: STRING, auth_type: STRING, secret_scope: STRING,
+    documentation_url: STRING, available_endpoints: STRING, example_calls: STRING,
+    status: STRING, user_who_requested: STRING>>'))
+) AS s
+ON t.api_name = s.api_name
+WHEN MATCHED THEN UPDATE SET
+  description = s.description,
+  connection_name = s.connection_name,
+  host = s.host,
+  base_path = s.base_path,
+  auth_type = s.auth_type,
+  secret_scope = s.secret_scope,
+  documentation_url = s.documentation_url,
+  available_endpoints = s.available_endpoints,
+  example_calls = s.example_calls,
+  status = s.status,
+  user_who_requested = s.user_who_requested,
+  modified_date = CURRENT_TIMESTAMP()
+WHEN NOT MATCHED THEN INSERT
+  (api_id, api_name, description, connection_name, host, base_path,
+   auth_type, secret_scope, documentation_url, available_endpoints, example_calls,
+   status, user_who_requested, created_at, modified_date)
+  VALUES (s.api_id, s.api_name, s.description, s.connection_name, s.host, s.base_path,
+   s.auth_type, s.secret_scope, s.documentation_url, s.available_endpoints, s.example_calls,
+   s.status, s.user_who_requested, CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP())""")
+
+# Re-registering an api_name keeps its existing api_id, so the ids are read back after a MERGE
+_REGISTRY_IDS_SQL = Template("""SELECT api_name, api_id
+FROM $table_name
+WHERE array_contains(from_json(:api_names, 'ARRAY<STRING>'), api_name)""")
+
+# Registry columns call_parameterized_api reads, looked up for one api_id or for a JSON array
+# of them
+_API_PARAMS_COLUMNS = (
+  'api_name', 'connection_name', 'host', 'base_path', 'api_path', 'http_method',
+  'parameters', 'auth_type', 'secret_scope', 'documentation_url',
+)
+
+_API_PARAMS_LOOKUP_SQL = Template(f"""SELECT {', '.join(_API_PARAMS_COLUMNS)}
+FROM $table_name
+WHERE api_id = :api_id""")
+
+_API_PARAMS_BATCH_SQL = Template(f"""SELECT api_id, {', '.join(_API_PARAMS_COLUMNS)}
+FROM $table_name
+WHERE array_contains(from_json(:api_ids, 'ARRAY<STRING>'), api_id)""")
 
 # Context variable to store user token for OBO authentication
 # This is set by execute_mcp_tool() before calling tools
@@ -24,36 +240,57 @@ _user_token_context: ContextVar[str | None] = ContextVar('user_token', default=N
 _credentials_context: ContextVar[dict | None] = ContextVar('credentials', default=None)
 
 
-def get_workspace_client() -> WorkspaceClient:
-  """Get a WorkspaceClient with on-behalf-of user authentication.
+# Shared keep-alive session for outbound HTTP (documentation fetches, endpoint discovery).
+# Throttling and transient 5xx responses are retried with backoff, honouring Retry-After up to
+# _HTTP_RETRY_AFTER_MAX seconds; once retries run out the last response is returned rather
+# than raised.
+_HTTP_RETRY_AFTER_MAX = 5.0
 
-  Falls back to OAuth service principal authentication if:
-  - User token is not available
-  - User has no access to SQL warehouses
 
-  Returns:
-      WorkspaceClient configured with appropriate authentication
-  """
-  host = os.environ.get('DATABRICKS_HOST')
+class _CappedRetry(Retry):
+  """Retry that waits at most _HTTP_RETRY_AFTER_MAX seconds for a Retry-After header."""
 
-  # Try to get user token from multiple sources (in order of preference)
-  # 1. First try the context variable (set by execute_mcp_tool)
-  user_token = _user_token_context.get()
-  if user_token:
-    print(f'[get_workspace_client] ✅ Got token from context variable')
-  else:
-    # 2. Fallback to request headers (for direct HTTP calls to tools)
-    headers = get_http_headers()
-    print(f'[get_workspace_client] Headers received: {list(headers.keys())}')
-    user_token = headers.get('x-forwarded-access-token')
+  def get_retry_after(self, response):
+    retry_after = super().get_retry_after(response)
+    return None if retry_after is None else min(retry_after, _HTTP_RETRY_AFTER_MAX)
 
-  print(f'[get_workspace_client] User token found: {bool(user_token)}')
-  if user_token:
-    print(f'[get_workspace_client] Token preview: {user_token[:20]}...')
 
+_HTTP_SESSION = requests.Session()
+_HTTP_RETRY = _CappedRetry(
+  total=3,
+  backoff_factor=0.3,
+  status_forcelist=(429, 500, 502, 503, 504),
+  respect_retry_after_header=True,
+  raise_on_status=False,
+)
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_HTTP_RETRY)
+_HTTP_SESSION.mount('http://', _HTTP_ADAPTER)
+_HTTP_SESSION.mount('https://', _HTTP_ADAPTER)
+
+# WorkspaceClients keyed by (host, token digest), stored with their expiry time. Each client
+# keeps its own HTTP connection pool, so reusing them skips re-authentication and the warehouse
+# access probe below. A service principal client handed to a user whose probe failed is only
+# kept for _WORKSPACE_CLIENT_FALLBACK_TTL seconds, so a transient failure is re-probed.
+_WORKSPACE_CLIENT_CACHE: OrderedDict[tuple[str, str], tuple[float, WorkspaceClient]] = OrderedDict()
+_WORKSPACE_CLIENT_CACHE_MAX = 256
+_WORKSPACE_CLIENT_FALLBACK_TTL = 60.0
+_WORKSPACE_CLIENT_LOCK = threading.Lock()
+
+
+def _token_digest(token: str | None) -> str:
+  """Hash a token for use as a cache key (empty string when there is no token)."""
+  return hashlib.blake2b(token.encode(), digest_size=16).hexdigest() if token else ''
+
+
+def _create_workspace_client(host: str, user_token: str | None) -> tuple[WorkspaceClient, bool]:
+  """Build a WorkspaceClient for the given user token, falling back to the service principal.
+
+  Returns:
+      The client, and whether it is a service principal fallback for a user token
+  """
   if user_token:
     # Try on-behalf-of authentication with user's token
-    print(f'🔐 Attempting OBO authentication for user')
+    logger.debug('Attempting OBO authentication for user')
     config = Config(host=host, token=user_token, auth_type='pat')
     user_client = WorkspaceClient(config=config)
 
@@ -64,27 +301,178 @@ def get_workspace_client() -> WorkspaceClient:
       warehouses = list(user_client.warehouses.list())
       if warehouses:
         has_warehouse_access = True
-        print(f'✅ User has access to {len(warehouses)} warehouse(s)')
+        logger.debug('User has access to %d warehouse(s)', len(warehouses))
     except Exception as e:
-      print(f'⚠️  User cannot list warehouses: {str(e)}')
+      logger.warning('User cannot list warehouses: %s', e)
 
     # If user has warehouse access, use OBO; otherwise fallback to service principal
     if has_warehouse_access:
-      print(f'✅ Using OBO authentication - user has warehouse access')
-      return user_client
+      logger.debug('Using OBO authentication - user has warehouse access')
+      return user_client, False
     else:
-      print(f'⚠️  User has no warehouse access, falling back to service principal')
-      return WorkspaceClient(host=host)
+      logger.debug('User has no warehouse access, falling back to service principal')
+      return WorkspaceClient(host=host), True
   else:
     # Fall back to OAuth service principal authentication
     # WorkspaceClient will automatically use DATABRICKS_CLIENT_ID and DATABRICKS_CLIENT_SECRET
     # which are injected by Databricks Apps platform
-    print(f'⚠️  No user token found, falling back to service principal')
-    return WorkspaceClient(host=host)
+    logger.debug('No user token found, falling back to service principal')
+    return WorkspaceClient(host=host), False
+
+
+def _caller_token() -> str | None:
+  """Return the current caller's OBO token, from the context variable or the request headers."""
+  return _user_token_context.get() or get_http_headers().get('x-forwarded-access-token')
+
+
+def get_workspace_client() -> WorkspaceClient:
+  """Get a WorkspaceClient with on-behalf-of user authentication.
+
+  Falls back to OAuth service principal authentication if:
+  - User token is not available
+  - User has no access to SQL warehouses
+
+  Clients are cached per (host, token) so repeated tool calls reuse the same client.
+
+  Returns:
+      WorkspaceClient configured with appropriate authentication
+  """
+  host = _databricks_host()
+
+  # Try to get user token from multiple sources (in order of preference)
+  # 1. First try the context variable (set by execute_mcp_tool)
+  user_token = _user_token_context.get()
+  if user_token:
+    logger.debug('[get_workspace_client] Got token from context variable')
+  else:
+    # 2. Fallback to request headers (for direct HTTP calls to tools)
+    headers = get_http_headers()
+    if logger.isEnabledFor(logging.DEBUG):
+      logger.debug('[get_workspace_client] Headers received: %s', list(headers.keys()))
+    user_token = headers.get('x-forwarded-access-token')
+
+  logger.debug('[get_workspace_client] User token found: %s', bool(user_token))
+  if user_token and logger.isEnabledFor(logging.DEBUG):
+    logger.debug('[get_workspace_client] Token preview: %s...', user_token[:20])
+
+  key = (host, _token_digest(user_token))
+  with _WORKSPACE_CLIENT_LOCK:
+    entry = _WORKSPACE_CLIENT_CACHE.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+      _WORKSPACE_CLIENT_CACHE.move_to_end(key)
+      return entry[1]
+
+  client, is_fallback = _create_workspace_client(host, user_token)
+  expires = time.monotonic() + _WORKSPACE_CLIENT_FALLBACK_TTL if is_fallback else math.inf
+  with _WORKSPACE_CLIENT_LOCK:
+    _WORKSPACE_CLIENT_CACHE[key] = (expires, client)
+    _WORKSPACE_CLIENT_CACHE.move_to_end(key)
+    while len(_WORKSPACE_CLIENT_CACHE) > _WORKSPACE_CLIENT_CACHE_MAX:
+      _WORKSPACE_CLIENT_CACHE.popitem(last=False)
+  return client
+
+
+def _in_worker_thread(fn):
+  """Run a blocking tool function in a worker thread so concurrent tool calls overlap.
+
+  The wrapper is a coroutine function with the same signature, so FastMCP awaits it instead of
+  running the blocking SDK calls on the event loop. asyncio.to_thread copies the current context,
+  so the OBO token and credentials context variables are still visible inside the tool.
+  """
+
+  @functools.wraps(fn)
+  async def wrapper(*args, **kwargs):
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
+  return wrapper
+
+
+def _sql_params(**values) -> list[StatementParameterListItem]:
+  """Build STRING statement parameters for named :markers (None binds SQL NULL)."""
+  return [StatementParameterListItem(name=k, value=v, type='STRING') for k, v in values.items()]
+
+
+def _http_params_json(params: dict | None) -> str | None:
+  """Encode query parameters as the JSON object bound to http_request()'s params map.
+
+  Non-string values are sent as their JSON text, e.g. 10 -> '10', True -> 'true',
+  None -> 'null'. Returns None (SQL NULL) when there are no parameters: an empty map() is
+  MAP<VOID,VOID>, which causes type errors.
+  """
+  if not params:
+    return None
+  return json.dumps({k: v if isinstance(v, str) else json.dumps(v) for k, v in params.items()})
+
+
+# Statement execution: wait briefly server-side, then poll with exponential backoff.
+# Statements still running MCP_STATEMENT_TIMEOUT seconds after they start running are
+# cancelled. Time spent PENDING (e.g. while a stopped warehouse starts up) does not count
+# towards that; it has its own, much longer, MCP_STATEMENT_PENDING_TIMEOUT.
+_STATEMENT_WAIT_TIMEOUT = '5s'
+_STATEMENT_POLL_INITIAL = 0.025
+_STATEMENT_POLL_MAX = 0.25
+_STATEMENT_IN_PROGRESS = frozenset({StatementState.PENDING, StatementState.RUNNING})
+
+
+def _run_statement(
+  w: WorkspaceClient,
+  timeout: float | None = None,
+  pending_timeout: float | None = None,
+  **kwargs
+) -> StatementResponse:
+  """Execute a SQL statement and wait for it to reach a terminal state.
+
+  Args:
+      w: WorkspaceClient to execute with
+      timeout: Seconds the statement may run before it is cancelled
+          (default: MCP_STATEMENT_TIMEOUT, 30)
+      pending_timeout: Seconds the statement may wait in PENDING, e.g. for the warehouse to
+          start, before it is cancelled (default: MCP_STATEMENT_PENDING_TIMEOUT, 600)
+      **kwargs: Passed through to statement_execution.execute_statement
+
+  Returns:
+      The final StatementResponse
+
+  Raises:
+      TimeoutError: If the statement did not finish in time
+  """
+  if timeout is None:
+    timeout = float(os.environ.get('MCP_STATEMENT_TIMEOUT', '30'))
+  if pending_timeout is None:
+    pending_timeout = float(os.environ.get('MCP_STATEMENT_PENDING_TIMEOUT', '600'))
+  pending_deadline = time.monotonic() + pending_timeout
+  deadline = None  # Starts counting once the statement is running
+  response = w.statement_execution.execute_statement(wait_timeout=_STATEMENT_WAIT_TIMEOUT, **kwargs)
+  backoff = _STATEMENT_POLL_INITIAL
+  while response.status and response.status.state in _STATEMENT_IN_PROGRESS:
+    now = time.monotonic()
+    if response.status.state == StatementState.PENDING:
+      limit, limit_deadline = pending_timeout, pending_deadline
+    else:
+      if deadline is None:
+        deadline = now + timeout
+      limit, limit_deadline = timeout, deadline
+    if now >= limit_deadline:
+      w.statement_execution.cancel_execution(response.statement_id)
+      raise TimeoutError(
+        f'Statement {response.statement_id} did not finish within {limit:g}s '
+        f'({response.status.state.value})'
+      )
+    time.sleep(backoff)
+    backoff = min(backoff * 2, _STATEMENT_POLL_MAX)
+    response = w.statement_execution.get_statement(response.statement_id)
+  return response
 
 
 def _execute_sql_query(
-  query: str, warehouse_id: str = None, catalog: str = None, schema: str = None, limit: int = 100
+  query: str,
+  warehouse_id: str = None,
+  catalog: str = None,
+  schema: str = None,
+  limit: int = 100,
+  shape: Literal['rows', 'columnar'] = 'rows',
+  client: WorkspaceClient = None,
+  parameters: list[StatementParameterListItem] = None,
 ) -> dict:
   """Helper function to execute SQL queries on Databricks SQL warehouse.
 
@@ -94,16 +482,20 @@ def _execute_sql_query(
       catalog: Catalog to use (optional)
       schema: Schema to use (optional)
       limit: Maximum number of rows to return (default: 100)
+      shape: 'rows' returns each row as a {column: value} dict; 'columnar' returns
+          each row as a list of values ordered like 'columns' (default: 'rows')
+      client: WorkspaceClient to reuse (optional, a new one is created if not provided)
+      parameters: Values for named :markers in the query (optional)
 
   Returns:
       Dictionary with query results or error message
   """
   try:
     # Initialize Databricks SDK with on-behalf-of authentication
-    w = get_workspace_client()
+    w = client or get_workspace_client()
 
     # Get warehouse ID from parameter or environment
-    warehouse_id = warehouse_id or os.environ.get('DATABRICKS_SQL_WAREHOUSE_ID')
+    warehouse_id = warehouse_id or _default_warehouse()
     if not warehouse_id:
       return {
         'success': False,
@@ -114,28 +506,27 @@ def _execute_sql_query(
 
     # Build the full query with catalog/schema if provided; if the query is an http_connection request then good else bad
     full_query = query
-    if "http_request(" in query.lower():
+    if _HTTP_REQUEST_RE.search(query) is not None:
       full_query = query
     elif catalog and schema:
       full_query = f'USE CATALOG {catalog}; USE SCHEMA {schema}; {query}'
 
-    print(f'🔧 Executing SQL on warehouse {warehouse_id}: {query[:100]}...')
+    logger.debug('Executing SQL on warehouse %s: %.100s...', warehouse_id, query)
 
     # Execute the query
-    result = w.statement_execution.execute_statement(
-      warehouse_id=warehouse_id, statement=full_query, wait_timeout='30s'
+    result = _run_statement(
+      w, warehouse_id=warehouse_id, statement=full_query, parameters=parameters
     )
-    print(f'⛁⛁⛁ Output executing SQL result: {result}')
+    logger.debug('SQL execution result: %s', result)
+    if result.status and result.status.state != StatementState.SUCCEEDED:
+      error = result.status.error.message if result.status.error else result.status.state.value
+      return {'success': False, 'error': f'Error: {error}'}
     # Process results
     if result.result and result.result.data_array:
       columns = [col.name for col in result.manifest.schema.columns]
-      data = []
-      
-      for row in result.result.data_array[:limit]:
-        row_dict = {}
-        for i, col in enumerate(columns):
-          row_dict[col] = row[i]
-        data.append(row_dict)
+      data = result.result.data_array[:limit]
+      if shape == 'rows':
+        data = [dict(zip(columns, row)) for row in data]
 
       return {'success': True, 'data': {'columns': columns, 'rows': data}, 'row_count': len(data)}
     else:
@@ -146,10 +537,338 @@ def _execute_sql_query(
       }
 
   except Exception as e:
-    print(f'❌ Error executing SQL: {str(e)}')
+    logger.error('Error executing SQL: %s', e)
     return {'success': False, 'error': f'Error: {str(e)}'}
 
 
+# Registry row lookups, keyed by (lookup kind, catalog, schema, api name/id, caller token digest).
+# Lookups run under the caller's own token, so entries are never shared between callers.
+# Entries are fresh for _REGISTRY_CACHE_TTL seconds; for a further _REGISTRY_CACHE_STALE
+# seconds they are still served while a background refresh re-reads the row.
+_REGISTRY_CACHE_TTL = 300.0
+_REGISTRY_CACHE_STALE = 300.0
+_REGISTRY_CACHE: dict[tuple, tuple[float, dict]] = {}
+_REGISTRY_CACHE_LOCK = threading.Lock()
+_REGISTRY_REFRESHING: set[tuple] = set()
+_REGISTRY_REFRESH_EXECUTOR = ThreadPoolExecutor(
+  max_workers=4, thread_name_prefix='registry-refresh'
+)
+
+
+def _registry_key(kind: str, catalog: str, schema: str, lookup_id: str) -> tuple:
+  """Build the current caller's cache key for a registry lookup."""
+  return (kind, catalog, schema, lookup_id, _token_digest(_caller_token()))
+
+
+def _store_registry_lookup(key: tuple, result: dict) -> None:
+  """Cache a registry lookup result if it found a row."""
+  if result.get('success') and result.get('data', {}).get('rows'):
+    with _REGISTRY_CACHE_LOCK:
+      _REGISTRY_CACHE[key] = (time.monotonic(), result)
+
+
+def _refresh_registry_lookup(
+  key: tuple, query: str, warehouse_id: str, parameters: list = None
+) -> dict:
+  """Run a registry lookup query and cache the result if it found a row."""
+  result = _execute_sql_query(
+    query, warehouse_id, catalog=None, schema=None, limit=1, parameters=parameters
+  )
+  _store_registry_lookup(key, result)
+  return result
+
+
+def _schedule_registry_refresh(
+  key: tuple, query: str, warehouse_id: str, parameters: list = None
+) -> None:
+  """Refresh a stale registry entry in the background (at most one refresh per key)."""
+  with _REGISTRY_CACHE_LOCK:
+    if key in _REGISTRY_REFRESHING:
+      return
+    _REGISTRY_REFRESHING.add(key)
+
+  # Copy the caller's context so the refresh authenticates as the same user
+  ctx = copy_context()
+
+  def _run():
+    try:
+      ctx.run(_refresh_registry_lookup, key, query, warehouse_id, parameters)
+    except Exception as e:
+      logger.warning('Background registry refresh failed for %s: %s', key, e)
+    finally:
+      with _REGISTRY_CACHE_LOCK:
+        _REGISTRY_REFRESHING.discard(key)
+
+  _REGISTRY_REFRESH_EXECUTOR.submit(_run)
+
+
+def _get_cached_registry_lookup(
+  key: tuple, query: str, warehouse_id: str, parameters: list = None
+) -> dict | None:
+  """Return a cached registry lookup, or None on a miss.
+
+  Stale entries are still returned, and a background refresh is scheduled for them.
+  """
+  with _REGISTRY_CACHE_LOCK:
+    entry = _REGISTRY_CACHE.get(key)
+
+  if entry:
+    age = time.monotonic() - entry[0]
+    if age < _REGISTRY_CACHE_TTL:
+      return entry[1]
+    if age < _REGISTRY_CACHE_TTL + _REGISTRY_CACHE_STALE:
+      _schedule_registry_refresh(key, query, warehouse_id, parameters)
+      return entry[1]
+  return None
+
+
+def _cached_registry_lookup(
+  key: tuple, query: str, warehouse_id: str, parameters: list = None
+) -> dict:
+  """Execute a single-row registry lookup, serving repeated lookups from the TTL cache.
+
+  Args:
+      key: Cache key from _registry_key(), e.g. for ('api_name', catalog, schema, api_name)
+      query: Lookup SQL to run on a cache miss
+      warehouse_id: SQL warehouse ID
+      parameters: Values for named :markers in the query (optional)
+
+  Returns:
+      Result dictionary in the same format as _execute_sql_query
+  """
+  cached = _get_cached_registry_lookup(key, query, warehouse_id, parameters)
+  if cached is not None:
+    return cached
+  return _refresh_registry_lookup(key, query, warehouse_id, parameters)
+
+
+# Registry columns execute_api_call looks up by api_name
+_REGISTRY_LOOKUP_COLUMNS = (
+  'connection_name', 'auth_type', 'secret_scope', 'host', 'base_path',
+  'available_endpoints', 'example_calls',
+)
+
+
+def _seed_registry_lookup(catalog: str, schema: str, row: dict) -> None:
+  """Cache a just-written registry row as execute_api_call's lookup result for its api_name."""
+  lookup_row = {column: row.get(column) for column in _REGISTRY_LOOKUP_COLUMNS}
+  result = {
+    'success': True,
+    'data': {'columns': list(_REGISTRY_LOOKUP_COLUMNS), 'rows': [lookup_row]},
+    'row_count': 1,
+  }
+  _store_registry_lookup(_registry_key('api_name', catalog, schema, row['api_name']), result)
+
+
+def _invalidate_registry_cache(catalog: str, schema: str, api_name: str) -> None:
+  """Drop every caller's cached lookups of an API whose registry row was just written.
+
+  Lookups by api_id are matched on the api_name in their cached row, so entries for an
+  api_id that a re-registration replaced are dropped as well.
+  """
+  with _REGISTRY_CACHE_LOCK:
+    keys = [
+      key for key, (_, result) in _REGISTRY_CACHE.items()
+      if key[1] == catalog and key[2] == schema and (
+        key[3] == api_name
+        or any(row.get('api_name') == api_name for row in result['data']['rows'])
+      )
+    ]
+    for key in keys:
+      del _REGISTRY_CACHE[key]
+
+
+def _clear_registry_cache(catalog: str = None, schema: str = None) -> int:
+  """Drop all cached registry lookups, or only those for one catalog/schema.
+
+  Returns:
+      Number of entries removed
+  """
+  with _REGISTRY_CACHE_LOCK:
+    keys = [
+      key for key in _REGISTRY_CACHE
+      if (catalog is None or key[1] == catalog) and (schema is None or key[2] == schema)
+    ]
+    for key in keys:
+      del _REGISTRY_CACHE[key]
+  return len(keys)
+
+
+def _merge_registry_rows(
+  w: WorkspaceClient, rows: list[dict], warehouse_id: str, catalog: str, schema: str
+) -> dict:
+  """Upsert registry rows (keyed on api_name) with a single MERGE statement.
+
+  Existing api_names keep their api_id; each row's 'api_id' is updated in place to the id
+  stored in the table.
+
+  Args:
+      w: WorkspaceClient to execute with
+      rows: Row dicts with the api_http_registry columns; for duplicate api_names the last wins
+      warehouse_id: SQL warehouse ID
+      catalog: Catalog name
+      schema: Schema name
+
+  Returns:
+      Result dictionary in the same format as _execute_sql_query
+  """
+  table_name = f'{catalog}.{schema}.api_http_registry'
+  unique_rows = {row['api_name']: row for row in rows}
+  result = _execute_sql_query(
+    _REGISTRY_MERGE_SQL.substitute(table_name=table_name),
+    warehouse_id, catalog=None, schema=None, limit=1, client=w,
+    parameters=_sql_params(rows=json.dumps(list(unique_rows.values()))),
+  )
+  if result.get('success'):
+    ids = _execute_sql_query(
+      _REGISTRY_IDS_SQL.substitute(table_name=table_name),
+      warehouse_id, catalog=None, schema=None, limit=len(unique_rows), client=w,
+      parameters=_sql_params(api_names=json.dumps(list(unique_rows))),
+    )
+    for id_row in ids.get('data', {}).get('rows', []) if ids.get('success') else []:
+      unique_rows[id_row['api_name']]['api_id'] = id_row['api_id']
+    for row in rows:
+      row['api_id'] = unique_rows[row['api_name']]['api_id']
+
+    # Drop lookups of the rows' previous versions (for every caller), then warm the cache so
+    # the first execute_api_call after registering skips the lookup
+    for row in unique_rows.values():
+      _invalidate_registry_cache(catalog, schema, row['api_name'])
+      _seed_registry_lookup(catalog, schema, row)
+  return result
+
+
+# Parsed documentation pages keyed by URL. Docs change rarely, so successful fetches are reused
+# for an hour instead of re-downloading the page on every call_parameterized_api call.
+_DOC_CACHE_TTL = 3600.0
+_DOC_CACHE_MAX = 128
+_DOC_CACHE: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_DOC_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_documentation(url: str) -> dict | None:
+  """Return a cached documentation fetch result, or None if missing or expired."""
+  with _DOC_CACHE_LOCK:
+    entry = _DOC_CACHE.get(url)
+  if entry and time.monotonic() - entry[0] < _DOC_CACHE_TTL:
+    return entry[1]
+  return None
+
+
+def _store_documentation(url: str, result: dict) -> None:
+  """Cache a successful documentation fetch, evicting the oldest entry when full."""
+  with _DOC_CACHE_LOCK:
+    _DOC_CACHE[url] = (time.monotonic(), result)
+    _DOC_CACHE.move_to_end(url)
+    while len(_DOC_CACHE) > _DOC_CACHE_MAX:
+      _DOC_CACHE.popitem(last=False)
+
+
+# current_user.me() results keyed by (host, digest of the token the client authenticates with),
+# so a service principal fallback client is never cached under the calling user's token.
+# Entries are stored with their expiry time.
+_USER_NAME_CACHE: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+_USER_NAME_CACHE_MAX = 256
+_USER_NAME_CACHE_TTL = 300.0
+_USER_NAME_CACHE_LOCK = threading.Lock()
+
+
+def _get_user_email(w: WorkspaceClient) -> str:
+  """Return the user name of the identity w authenticates as, calling current_user.me() once.
+
+  Args:
+      w: WorkspaceClient authenticated as the current caller
+
+  Returns:
+      User name (email) of the authenticated identity
+  """
+  key = (w.config.host, _token_digest(w.config.token))
+  with _USER_NAME_CACHE_LOCK:
+    entry = _USER_NAME_CACHE.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+      _USER_NAME_CACHE.move_to_end(key)
+      return entry[1]
+
+  user_name = w.current_user.me().user_name
+  with _USER_NAME_CACHE_LOCK:
+    _USER_NAME_CACHE[key] = (time.monotonic() + _USER_NAME_CACHE_TTL, user_name)
+    _USER_NAME_CACHE.move_to_end(key)
+    while len(_USER_NAME_CACHE) > _USER_NAME_CACHE_MAX:
+      _USER_NAME_CACHE.popitem(last=False)
+  return user_name
+
+
+def _parse_http_response(sql_result: StatementResponse):
+  """Decode the http_request() JSON in the first cell of a statement result.
+
+  Returns:
+      The parsed response, the raw text if it is not JSON, or None if there is no result
+  """
+  if not (sql_result.result and sql_result.result.data_array and sql_result.result.data_array[0]):
+    return None
+  response_str = sql_result.result.data_array[0][0]
+  try:
+    return json.loads(response_str)
+  except (json.JSONDecodeError, ValueError, TypeError):
+    return response_str
+
+
+def _response_text(response: requests.Response) -> str:
+  """Decode a response body with its declared charset, skipping requests' charset detection."""
+  return response.content.decode(response.encoding or 'utf-8', errors='replace')
+
+
+def _first_unique_matches(pattern: re.Pattern, content: str, limit: int = 10) -> list[str]:
+  """Return up to limit distinct matches in document order, stopping the scan once found."""
+  seen = set()
+  matches = []
+  for match in pattern.finditer(content):
+    value = match.group(0)
+    if value not in seen:
+      seen.add(value)
+      matches.append(value)
+      if len(matches) == limit:
+        break
+  return matches
+
+
+def _project_fields(body, fields: list[str]):
+  """Keep only the given top-level keys of a JSON object, or of each object in a JSON array."""
+  if isinstance(body, dict):
+    return {k: body[k] for k in fields if k in body}
+  if isinstance(body, list):
+    return [_project_fields(item, fields) for item in body]
+  return body
+
+
+# Exact-type dispatch for values stored in the registry's JSON string columns
+_JSON_COERCERS = {
+  list: lambda value: json.dumps(value, separators=(',', ':')),
+  str: lambda value: value,
+}
+
+
+def _coerce_json(value, field_name: str) -> str | None:
+  """Convert a list (or an already-serialized JSON string) to a JSON string for storage.
+
+  Args:
+      value: List to serialize, JSON string to pass through, or None/empty
+      field_name: Parameter name used in the error message
+
+  Returns:
+      JSON string, or None if value is empty
+
+  Raises:
+      ValueError: If value is neither a list nor a string
+  """
+  if not value:
+    return None
+  coerce = _JSON_COERCERS.get(type(value))
+  if coerce is None:
+    raise ValueError(f'{field_name} must be list or JSON string, got {type(value).__name__}')
+  return coerce(value)
+
+
 def load_tools(mcp_server):
   """Register all MCP tools with the server.
 
@@ -171,7 +890,7 @@ def load_tools(mcp_server):
         # Use user's token for on-behalf-of authentication
         # Create Config with ONLY token auth to avoid OAuth conflict
         # auth_type='pat' forces token-only auth and disables auto-detection
-        config = Config(host=os.environ.get('DATABRICKS_HOST'), token=user_token, auth_type='pat')
+        config = Config(host=_databricks_host(), token=user_token, auth_type='pat')
         w = WorkspaceClient(config=config)
         current_user = w.current_user.me()
         user_info = {
@@ -185,7 +904,7 @@ def load_tools(mcp_server):
     return {
       'status': 'healthy',
       'service': 'databricks-api-registry-http',
-      'databricks_configured': bool(os.environ.get('DATABRICKS_HOST')),
+      'databricks_configured': bool(_databricks_host()),
       'auth_mode': 'on-behalf-of' if user_token_present else 'service-principal',
       'user_auth_available': user_token_present,
       'authenticated_user': user_info,
@@ -199,6 +918,7 @@ def load_tools(mcp_server):
     catalog: str = None,
     schema: str = None,
     limit: int = 100,
+    shape: Literal['rows', 'columnar'] = 'columnar',
   ) -> dict:
     """Execute a SQL query on Databricks SQL warehouse.
 
@@ -208,11 +928,15 @@ def load_tools(mcp_server):
         catalog: Catalog to use (optional)
         schema: Schema to use (optional)
         limit: Maximum number of rows to return (default: 100)
+        shape: Result layout (default: 'columnar')
+            - 'columnar': data = {"columns": [...], "rows": [[v1, v2, ...], ...]}
+              where each row is a list of values in the same order as columns
+            - 'rows': data = {"columns": [...], "rows": [{"col1": v1, ...}, ...]}
 
     Returns:
         Dictionary with query results or error message
     """
-    return _execute_sql_query(query, warehouse_id, catalog, schema, limit)
+    return _execute_sql_query(query, warehouse_id, catalog, schema, limit, shape=shape)
 
   @mcp_server.tool
   def list_warehouses() -> dict:
@@ -226,21 +950,18 @@ def load_tools(mcp_server):
       w = get_workspace_client()
 
       # List SQL warehouses
-      warehouses = []
-      for warehouse in w.warehouses.list():
-        warehouses.append(
-          {
-            'id': warehouse.id,
-            'name': warehouse.name,
-            'state': warehouse.state.value if warehouse.state else 'UNKNOWN',
-            'size': warehouse.cluster_size,
-            'type': warehouse.warehouse_type.value if warehouse.warehouse_type else 'UNKNOWN',
-            'creator': warehouse.creator_name if hasattr(warehouse, 'creator_name') else None,
-            'auto_stop_mins': warehouse.auto_stop_mins
-            if hasattr(warehouse, 'auto_stop_mins')
-            else None,
-          }
-        )
+      warehouses = [
+        {
+          'id': warehouse.id,
+          'name': warehouse.name,
+          'state': warehouse.state.value if warehouse.state else 'UNKNOWN',
+          'size': warehouse.cluster_size,
+          'type': warehouse.warehouse_type.value if warehouse.warehouse_type else 'UNKNOWN',
+          'creator': getattr(warehouse, 'creator_name', None),
+          'auto_stop_mins': getattr(warehouse, 'auto_stop_mins', None),
+        }
+        for warehouse in w.warehouses.list()
+      ]
 
       return {
         'success': True,
@@ -250,7 +971,7 @@ def load_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing warehouses: {str(e)}')
+      logger.error('Error listing warehouses: %s', e)
       return {'success': False, 'error': f'Error: {str(e)}', 'warehouses': [], 'count': 0}
 
   @mcp_server.tool
@@ -268,16 +989,15 @@ def load_tools(mcp_server):
       w = get_workspace_client()
 
       # List files in DBFS
-      files = []
-      for file_info in w.dbfs.list(path):
-        files.append(
-          {
-            'path': file_info.path,
-            'is_dir': file_info.is_dir,
-            'size': file_info.file_size if not file_info.is_dir else None,
-            'modification_time': file_info.modification_time,
-          }
-        )
+      files = [
+        {
+          'path': file_info.path,
+          'is_dir': file_info.is_dir,
+          'size': file_info.file_size if not file_info.is_dir else None,
+          'modification_time': file_info.modification_time,
+        }
+        for file_info in w.dbfs.list(path)
+      ]
 
       return {
         'success': True,
@@ -288,7 +1008,7 @@ def load_tools(mcp_server):
       }
 
     except Exception as e:
-      print(f'❌ Error listing DBFS files: {str(e)}')
+      logger.error('Error listing DBFS files: %s', e)
       return {'success': False, 'error': f'Error: {str(e)}', 'files': [], 'count': 0}
 
   # ========================================
@@ -317,13 +1037,13 @@ def load_tools(mcp_server):
     Uses service principal credentials directly to bypass OAuth token scope limitations.
     The service principal must have WRITE permission on the secret scopes.
     """
-    host = os.environ.get('DATABRICKS_HOST')
+    host = _databricks_host()
     client_id = os.environ.get('DATABRICKS_CLIENT_ID')
     client_secret = os.environ.get('DATABRICKS_CLIENT_SECRET')
-    
+
     if client_id and client_secret:
       # Use OAuth M2M with service principal credentials
-      print(f"🔐 Using service principal for secrets: {client_id}")
+      logger.debug('Using service principal for secrets: %s', client_id)
       config = Config(
         host=host,
         client_id=client_id,
@@ -333,7 +1053,7 @@ def load_tools(mcp_server):
       return WorkspaceClient(config=config)
     else:
       # Fallback to default client
-      print(f"⚠️  No service principal credentials found, using default client")
+      logger.debug('No service principal credentials found, using default client')
       return get_workspace_client()
 
   def _create_secret_scope(scope_name: str) -> dict:
@@ -346,57 +1066,51 @@ def load_tools(mcp_server):
         existing_scopes = list(w.secrets.list_scopes())
         scope_exists = any(s.name == scope_name for s in existing_scopes)
         if scope_exists:
-          print(f"✅ Secret scope already exists: {scope_name}")
+          logger.debug('Secret scope already exists: %s', scope_name)
           return {'success': True, 'scope_name': scope_name, 'created': False}
       except Exception:
         pass
 
       # Create the scope
       w.secrets.create_scope(scope=scope_name)
-      print(f"✅ Created secret scope: {scope_name}")
+      logger.info('Created secret scope: %s', scope_name)
       return {'success': True, 'scope_name': scope_name, 'created': True}
 
     except Exception as e:
-      if "already exists" in str(e).lower():
-        print(f"✅ Secret scope already exists: {scope_name}")
+      if 'already exists' in str(e).lower():
+        logger.debug('Secret scope already exists: %s', scope_name)
         return {'success': True, 'scope_name': scope_name, 'created': False}
-      print(f"❌ Error creating secret scope: {str(e)}")
+      logger.error('Error creating secret scope: %s', e)
       return {'success': False, 'error': str(e)}
 
   def _store_secret(scope_name: str, key_name: str, secret_value: str) -> dict:
     """Store a secret in a Databricks secret scope."""
-    print(f"🔐 [_store_secret] Attempting to store secret:")
-    print(f"    Scope: {scope_name}")
-    print(f"    Key: {key_name}")
-    print(f"    Value length: {len(secret_value)} chars")
-    
+    logger.debug(
+      '[_store_secret] Attempting to store secret: scope=%s key=%s value_length=%d',
+      scope_name, key_name, len(secret_value)
+    )
+
     try:
       w = _get_secrets_client()
-      print(f"🔐 [_store_secret] Got workspace client, calling put_secret...")
-      
       w.secrets.put_secret(scope=scope_name, key=key_name, string_value=secret_value)
-      
-      print(f"🔐 [_store_secret] put_secret() completed successfully!")
-      print(f"✅ Stored secret: {scope_name}/{key_name}")
-      
-      # VERIFY it was actually created
-      try:
-        print(f"🔍 [_store_secret] Verifying secret was created...")
-        secrets_list = list(w.secrets.list_secrets(scope=scope_name))
-        secret_keys = [s.key for s in secrets_list]
-        if key_name in secret_keys:
-          print(f"✅ [_store_secret] Verification: Secret {key_name} found in scope!")
-        else:
-          print(f"⚠️  [_store_secret] Verification: Secret {key_name} NOT found! Keys: {secret_keys}")
-      except Exception as verify_error:
-        print(f"⚠️  [_store_secret] Could not verify secret creation: {verify_error}")
-      
+      logger.debug('[_store_secret] Stored secret: %s/%s', scope_name, key_name)
+
+      # VERIFY it was actually created (extra REST round-trip, so only when debugging)
+      if logger.isEnabledFor(logging.DEBUG):
+        try:
+          secret_keys = [s.key for s in w.secrets.list_secrets(scope=scope_name)]
+          if key_name in secret_keys:
+            logger.debug('[_store_secret] Verification: secret %s found in scope', key_name)
+          else:
+            logger.warning(
+              '[_store_secret] Verification: secret %s NOT found! Keys: %s', key_name, secret_keys
+            )
+        except Exception as verify_error:
+          logger.warning('[_store_secret] Could not verify secret creation: %s', verify_error)
+
       return {'success': True, 'scope_name': scope_name, 'key_name': key_name}
     except Exception as e:
-      print(f"❌ [_store_secret] Error storing secret: {str(e)}")
-      print(f"❌ [_store_secret] Error type: {type(e).__name__}")
-      import traceback
-      traceback.print_exc()
+      logger.exception('Error storing secret scope=%s key=%s', scope_name, key_name)
       return {'success': False, 'error': str(e)}
 
   def _create_http_connection_sql(
@@ -414,86 +1128,62 @@ def load_tools(mcp_server):
 
     NOTE: Creates connection in specified catalog.schema by setting context first.
     """
-    if auth_type not in ['none', 'api_key', 'bearer_token']:
-      raise ValueError(f"auth_type must be 'none', 'api_key', or 'bearer_token'")
+    if auth_type not in _VALID_AUTH_TYPES:
+      raise ValueError("auth_type must be 'none', 'api_key', or 'bearer_token'")
     # Create connection with simple name (catalog/schema set via execute_statement params)
     # NOTE: Don't use IF NOT EXISTS - it may not be supported for connections
     # IMPORTANT: Host must include https:// protocol
     host_with_protocol = host if host.startswith('https://') else f'https://{host}'
 
-    sql = f"""CREATE CONNECTION {connection_name}
-  TYPE HTTP
-  OPTIONS (
-    host '{host_with_protocol}',
-    port '{port}'"""
-
-    if base_path:
-      sql += f""",
-    base_path '{base_path}'"""
-
-    # Handle bearer_token based on auth_type
-    if auth_type == 'bearer_token':
-      # Use secret reference for bearer token auth
-      # The bearer token is stored in the connection and automatically used
-      if not api_name:
-        raise ValueError("api_name is required for bearer_token authentication")
-      # Use dedicated bearer token scope with simple API name as key
-      scope_name = os.environ.get('MCP_BEARER_TOKEN_SCOPE', 'mcp_bearer_tokens')
-      secret_key = api_name  # Simple: just the API name
-      sql += f""",
-    bearer_token secret('{scope_name}', '{secret_key}')"""
-    elif auth_type == 'api_key':
-      # For API key auth, connection has EMPTY bearer_token
-      # The API key is stored in secrets and passed as a param at runtime
-      sql += f""",
-    bearer_token ''"""
-    else:
-      # For public APIs (auth_type='none'), use empty string
-      sql += f""",
-    bearer_token ''"""
+    # Bearer token connections reference the secret; api_key/none connections have an
+    # EMPTY bearer_token (API keys are passed as a param at runtime)
+    if auth_type == 'bearer_token' and not api_name:
+      raise ValueError('api_name is required for bearer_token authentication')
 
+    # CREATE CONNECTION cannot take parameter markers, so quote-escape the literal values
     comment = description or f'HTTP connection for {host}'
-    # Escape single quotes in comment to prevent SQL syntax errors
-    comment_escaped = comment.replace("'", "''")
-    sql += f"""
-  )
-  COMMENT '{comment_escaped}';"""
-    return sql
+    return _CONNECTION_SQL_TEMPLATES[auth_type].substitute(
+      connection_name=connection_name,
+      host=host_with_protocol.translate(_SQL_QUOTE_TABLE),
+      port=port,
+      base_path_clause=(
+        f",\n    base_path '{base_path.translate(_SQL_QUOTE_TABLE)}'" if base_path else ''
+      ),
+      scope=_bearer_scope(),
+      secret_key=api_name,  # Simple: just the API name
+      comment=comment.translate(_SQL_QUOTE_TABLE),
+    )
 
-  def _execute_create_connection_sql(sql: str, warehouse_id: str, catalog: str, schema: str) -> dict:
+  def _execute_create_connection_sql(
+    w: WorkspaceClient, sql: str, warehouse_id: str, catalog: str, schema: str
+  ) -> dict:
     """Execute CREATE CONNECTION SQL statement with catalog/schema context."""
     try:
-      w = get_workspace_client()
+      # Debug: Log the exact SQL being executed
+      logger.debug(
+        'Executing CREATE CONNECTION SQL in %s.%s on warehouse %s:\n%s',
+        catalog, schema, warehouse_id, sql
+      )
 
-      # Debug: Print the exact SQL being executed
-      print(f"🔍 Executing CREATE CONNECTION SQL:")
-      print(f"   Catalog: {catalog}")
-      print(f"   Schema: {schema}")
-      print(f"   Warehouse: {warehouse_id}")
-      print(f"   SQL Statement:")
-      print("=" * 80)
-      print(sql)
-      print("=" * 80)
-
-      result = w.statement_execution.execute_statement(
+      result = _run_statement(
+        w,
         warehouse_id=warehouse_id,
         statement=sql,
         catalog=catalog,
-        schema=schema,
-        wait_timeout="30s"
+        schema=schema
       )
 
       if result.status and result.status.state:
         state = result.status.state.value
-        if state == "SUCCEEDED":
-          print(f"✅ Connection created via SQL in {catalog}.{schema}")
+        if state == 'SUCCEEDED':
+          logger.debug('Connection created via SQL in %s.%s', catalog, schema)
           return {'success': True, 'state': state}
-        error_msg = result.status.error.message if result.status.error else "Unknown error"
-        print(f"❌ Connection creation failed: {error_msg}")
+        error_msg = result.status.error.message if result.status.error else 'Unknown error'
+        logger.error('Connection creation failed: %s', error_msg)
         return {'success': False, 'error': error_msg, 'state': state}
       return {'success': False, 'error': 'No status from SQL execution'}
     except Exception as e:
-      print(f"❌ Error executing CREATE CONNECTION: {str(e)}")
+      logger.error('Error executing CREATE CONNECTION: %s', e)
       return {'success': False, 'error': str(e)}
 
   # ========================================
@@ -505,16 +1195,17 @@ def load_tools(mcp_server):
     api_name: str,
     description: str,
     host: str,
-    auth_type: str,
+    auth_type: _AuthType,
     warehouse_id: str,
     catalog: str,
     schema: str,
     base_path: str = '',
     secret_value: str = None,
-    available_endpoints: list = None,
-    example_calls: list = None,
+    available_endpoints: list[dict] | str = None,
+    example_calls: list[dict] | str = None,
     documentation_url: str = None,
-    port: int = 443
+    port: int = 443,
+    write_row: bool = True
   ) -> dict:
     """Private implementation for API registration with SQL-based connections.
     
@@ -525,62 +1216,63 @@ def load_tools(mcp_server):
             Example: [{"path": "/repos", "description": "Repository operations", "method": "GET"}]
         example_calls: List of dicts with concrete usage examples
             Example: [{"description": "Get a repo", "path": "/repos/owner/repo", "params": {"type": "public"}}]
+        write_row: Upsert the registry row (default: True). When False, the secret and
+            connection are still set up and the row is returned as 'row' for a batched write.
     
-    Both parameters are INFORMATIONAL ONLY - users can call ANY path at runtime.
-    """
-    try:
-      import json
+    available_endpoints and example_calls are INFORMATIONAL ONLY - users can call ANY path
+    at runtime.
 
-      # Validate auth_type
-      if auth_type not in ['none', 'api_key', 'bearer_token']:
-        return {'success': False, 'error': f"auth_type must be 'none', 'api_key', or 'bearer_token', got: {auth_type}"}
+    The register_api tool schema already validates argument types; auth_type is checked here
+    as well because register_apis_bulk passes plain dicts.
+    """
+    if auth_type not in _VALID_AUTH_TYPES:
+      return {
+        'success': False,
+        'error': f"auth_type must be 'none', 'api_key', or 'bearer_token', got: {auth_type}",
+      }
 
+    try:
       # SECURE: ALWAYS check credentials context FIRST (ignore secret_value parameter)
       # This prevents LLM from passing placeholder values like "YOUR_BEARER_TOKEN"
-      if auth_type in ['api_key', 'bearer_token']:
+      if auth_type in _SECRET_AUTH_TYPES:
         credentials = _credentials_context.get()
-        print(f'🔐 [register_api] Auth type: {auth_type}, API name: {api_name}')
-        print(f'🔐 [register_api] secret_value param provided: {bool(secret_value)} (length: {len(secret_value) if secret_value else 0})')
-        print(f'🔐 [register_api] Credentials from context: {bool(credentials)}')
-        
+        logger.debug(
+          '[register_api] Auth type: %s, API name: %s, secret_value param provided: %s, '
+          'credentials from context: %s',
+          auth_type, api_name, bool(secret_value), bool(credentials)
+        )
+
         if credentials:
-          print(f'    Credential keys available: {list(credentials.keys())}')
+          if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('[register_api] Credential keys available: %s', list(credentials.keys()))
           context_secret = credentials.get(auth_type)
           if context_secret:
             # ALWAYS prefer context over parameter (prevents LLM placeholder bug)
             secret_value = context_secret
-            value_preview = secret_value[:10] + '...' if len(secret_value) > 10 else secret_value
-            print(f'✅ [register_api] Using credential from CONTEXT for {api_name}: {value_preview} ({len(secret_value)} chars)')
+            logger.debug(
+              '[register_api] Using credential from CONTEXT for %s (%d chars)',
+              api_name, len(secret_value)
+            )
           else:
-            print(f'❌ [register_api] Credential key "{auth_type}" not found in context! Available: {list(credentials.keys())}')
+            logger.warning(
+              '[register_api] Credential key "%s" not found in context! Available: %s',
+              auth_type, list(credentials.keys())
+            )
         else:
-          print(f'⚠️  [register_api] No credentials in context, using parameter if provided')
-        
+          logger.debug('[register_api] No credentials in context, using parameter if provided')
+
         if not secret_value:
           return {'success': False, 'error': f"secret_value required for auth_type '{auth_type}'. Please provide your credential first."}
 
-      # Convert available_endpoints list to JSON string for storage
-      available_endpoints_str = None
-      if available_endpoints:
-        if isinstance(available_endpoints, list):
-          available_endpoints_str = json.dumps(available_endpoints)
-        elif isinstance(available_endpoints, str):
-          available_endpoints_str = available_endpoints
-        else:
-          return {'success': False, 'error': f'available_endpoints must be list or JSON string, got {type(available_endpoints).__name__}'}
-
-      # Convert example_calls list to JSON string for storage
-      example_calls_str = None
-      if example_calls:
-        if isinstance(example_calls, list):
-          example_calls_str = json.dumps(example_calls)
-        elif isinstance(example_calls, str):
-          example_calls_str = example_calls
-        else:
-          return {'success': False, 'error': f'example_calls must be list or JSON string, got {type(example_calls).__name__}'}
+      # Convert available_endpoints / example_calls lists to JSON strings for storage
+      try:
+        available_endpoints_str = _coerce_json(available_endpoints, 'available_endpoints')
+        example_calls_str = _coerce_json(example_calls, 'example_calls')
+      except ValueError as e:
+        return {'success': False, 'error': str(e)}
 
       api_id = str(uuid.uuid4())
-      connection_name = f"{api_name.lower().replace(' ', '_')}_connection"
+      connection_name = f'{api_name.translate(_CONN_NAME_TRANS).lower()}_connection'
       secret_scope = None
 
       # Step 1: Create secret scope and store secret (only for authenticated APIs)
@@ -588,36 +1280,32 @@ def load_tools(mcp_server):
       # For public APIs, we'll use a literal placeholder instead
       secret_scope = None
 
-      if auth_type in ['api_key', 'bearer_token']:
+      if auth_type in _SECRET_AUTH_TYPES:
         # Use separate scopes for API keys vs bearer tokens for better organization
         # Scopes should be pre-created by an admin
         if auth_type == 'api_key':
-          scope_name = os.environ.get('MCP_API_KEY_SCOPE', 'mcp_api_keys')
+          scope_name = _api_key_scope()
           secret_key = api_name  # Simple: just the API name
         else:  # bearer_token
-          scope_name = os.environ.get('MCP_BEARER_TOKEN_SCOPE', 'mcp_bearer_tokens')
+          scope_name = _bearer_scope()
           secret_key = api_name  # Simple: just the API name
-        
+
         # Try to create the scope (will succeed if it doesn't exist and user has perms)
         # If it fails, we'll try to use it anyway (assuming it was pre-created)
         scope_result = _create_secret_scope(scope_name)
-        
+
         if not scope_result.get('success'):
-          print(f"⚠️  Could not create secret scope '{scope_name}': {scope_result.get('error')}")
-          print(f"⚠️  Assuming scope was pre-created by admin. Attempting to store secret...")
-        
-        print(f"🔐 [register_api] About to store secret:")
-        print(f"    Scope: {scope_name}")
-        print(f"    Key: {secret_key}")
-        print(f"    Value length: {len(secret_value)} chars")
-        
+          logger.warning(
+            "Could not create secret scope '%s': %s. "
+            'Assuming scope was pre-created by admin. Attempting to store secret...',
+            scope_name, scope_result.get('error')
+          )
+
         secret_result = _store_secret(scope_name, secret_key, secret_value)
-        
-        print(f"🔐 [register_api] Secret storage result: {secret_result}")
-        
+        logger.debug('[register_api] Secret storage result: %s', secret_result)
+
         if not secret_result.get('success'):
-          scope_type = "API keys" if auth_type == 'api_key' else "bearer tokens"
-          print(f"❌ [register_api] SECRET STORAGE FAILED!")
+          scope_type = 'API keys' if auth_type == 'api_key' else 'bearer tokens'
           return {
             'success': False,
             'error': f"Failed to store secret: {secret_result.get('error')}",
@@ -632,32 +1320,34 @@ def load_tools(mcp_server):
               f"3. Redeploy the app: ./deploy.sh\n\n"
               f"Find your service principal ID: Databricks UI → Compute → Apps → Your App\n\n"
               f"Or set custom scope names via environment variables:\n"
-              f"  - MCP_API_KEY_SCOPE (current: {os.environ.get('MCP_API_KEY_SCOPE', 'mcp_api_keys')})\n"
-              f"  - MCP_BEARER_TOKEN_SCOPE (current: {os.environ.get('MCP_BEARER_TOKEN_SCOPE', 'mcp_bearer_tokens')})"
+              f"  - MCP_API_KEY_SCOPE (current: {_api_key_scope()})\n"
+              f"  - MCP_BEARER_TOKEN_SCOPE (current: {_bearer_scope()})"
             )
           }
-        
-        print(f"✅ Stored secret in {auth_type} scope: {scope_name}/{secret_key}")
+
+        logger.debug('Stored secret in %s scope: %s/%s', auth_type, scope_name, secret_key)
         secret_scope = scope_name
       # For public APIs (auth_type='none'), we don't create secrets at all
 
+      # One client for the DROP, CREATE, audit lookup and INSERT below
+      w = get_workspace_client()
+
       # Step 2: Drop existing connection if it exists (to handle auth type changes)
-      print(f"🗑️  Dropping connection '{connection_name}' if it exists...")
-      drop_sql = f"DROP CONNECTION {connection_name};"
+      logger.debug("Dropping connection '%s' if it exists...", connection_name)
+      drop_sql = f'DROP CONNECTION {connection_name};'
       try:
-        w = get_workspace_client()
-        drop_result = w.statement_execution.execute_statement(
+        drop_result = _run_statement(
+          w,
           warehouse_id=warehouse_id,
           statement=drop_sql,
           catalog=catalog,
-          schema=schema,
-          wait_timeout="30s"
+          schema=schema
         )
-        if drop_result.status and drop_result.status.state.value == "SUCCEEDED":
-          print(f"✅ Dropped existing connection")
+        if drop_result.status and drop_result.status.state.value == 'SUCCEEDED':
+          logger.debug('Dropped existing connection')
       except Exception as e:
         # Connection doesn't exist or other error - that's OK, we'll create it fresh
-        print(f"⚠️  Could not drop connection (likely doesn't exist): {str(e)[:200]}")
+        logger.debug("Could not drop connection (likely doesn't exist): %.200s", e)
         # Continue anyway
 
       # Step 3: Create HTTP connection via SQL
@@ -673,49 +1363,33 @@ def load_tools(mcp_server):
         description=description
       )
 
-      sql_result = _execute_create_connection_sql(create_sql, warehouse_id, catalog, schema)
+      sql_result = _execute_create_connection_sql(w, create_sql, warehouse_id, catalog, schema)
       if not sql_result.get('success'):
         return {'success': False, 'error': f"Failed to create connection: {sql_result.get('error')}"}
 
-      # Step 3: Register in database
-      w = get_workspace_client()
-      user_email = w.current_user.me().user_name
-      table_name = f'{catalog}.{schema}.api_http_registry'
-      now = datetime.now(timezone.utc).isoformat()
-
-      def escape_sql_string(s):
-        if s is None:
-          return None
-        return s.replace("'", "''").replace("\\", "\\\\")
-
-      insert_query = f"""
-INSERT INTO {table_name}
-(api_id, api_name, description, connection_name, host, base_path,
- auth_type, secret_scope, documentation_url, available_endpoints, example_calls,
- status, user_who_requested, created_at, modified_date)
-VALUES (
-  '{api_id}',
-  '{escape_sql_string(api_name)}',
-  '{escape_sql_string(description)}',
-  '{connection_name}',
-  '{host}',
-  {f"'{escape_sql_string(base_path)}'" if base_path else 'NULL'},
-  '{auth_type}',
-  {f"'{secret_scope}'" if secret_scope else 'NULL'},
-  {f"'{escape_sql_string(documentation_url)}'" if documentation_url else 'NULL'},
-  {f"'{escape_sql_string(available_endpoints_str)}'" if available_endpoints_str else 'NULL'},
-  {f"'{escape_sql_string(example_calls_str)}'" if example_calls_str else 'NULL'},
-  'registered',
-  '{user_email}',
-  '{now}',
-  '{now}'
-)
-"""
-
-      result = _execute_sql_query(insert_query, warehouse_id, catalog=None, schema=None, limit=1)
+      # Step 4: Register in database
+      row = {
+        'api_id': api_id,
+        'api_name': api_name,
+        'description': description,
+        'connection_name': connection_name,
+        'host': host,
+        'base_path': base_path or None,
+        'auth_type': auth_type,
+        'secret_scope': secret_scope,
+        'documentation_url': documentation_url or None,
+        'available_endpoints': available_endpoints_str,
+        'example_calls': example_calls_str,
+        'status': 'registered',
+        'user_who_requested': _get_user_email(w),
+      }
+      if not write_row:
+        return {'success': True, 'row': row}
 
+      result = _merge_registry_rows(w, [row], warehouse_id, catalog, schema)
       if not result.get('success'):
         return {'success': False, 'error': f"Failed to insert into registry: {result.get('error')}"}
+      api_id = row['api_id']  # The existing id if this api_name was already registered
 
       return {
         'success': True,
@@ -732,22 +1406,23 @@ VALUES (
       }
 
     except Exception as e:
-      print(f'❌ Error registering API: {str(e)}')
+      logger.error('Error registering API: %s', e)
       return {'success': False, 'error': str(e)}
 
   @mcp_server.tool
+  @_in_worker_thread
   def register_api(
     api_name: str,
     description: str,
     host: str,
-    auth_type: str,
+    auth_type: _AuthType,
     warehouse_id: str,
     catalog: str,
     schema: str,
     base_path: str = '',
     secret_value: str = None,
-    available_endpoints: list = None,
-    example_calls: list = None,
+    available_endpoints: list[dict] = None,
+    example_calls: list[dict] = None,
     documentation_url: str = None,
     port: int = 443
   ) -> dict:
@@ -831,6 +1506,111 @@ VALUES (
     )
 
   @mcp_server.tool
+  @_in_worker_thread
+  def register_apis_bulk(
+    apis: list[dict],
+    warehouse_id: str,
+    catalog: str,
+    schema: str
+  ) -> dict:
+    """Register several APIs at once, writing all registry rows in a single statement.
+
+    Each API gets its UC HTTP connection exactly as with register_api (connections are set up
+    concurrently), then every successful API is upserted into the registry table with one
+    MERGE keyed on api_name; APIs that were already registered keep their api_id. Use this when bootstrapping or migrating many APIs.
+
+    Args:
+        apis: List of dicts, each with the register_api arguments for one API
+            (api_name, description, host, auth_type, and optionally base_path, secret_value,
+            available_endpoints, example_calls, documentation_url, port). Only public APIs
+            (auth_type 'none') can be registered in bulk; register authenticated APIs with
+            register_api so their credential comes from the secure credentials context.
+            If an api_name appears more than once, the last definition is registered.
+        warehouse_id: SQL warehouse ID
+        catalog: Catalog name
+        schema: Schema name
+
+    Returns:
+        Dictionary with the registered APIs and per-API errors for any that failed
+    """
+    if not catalog or not schema:
+      return {'success': False, 'error': 'catalog and schema parameters are required'}
+
+    def check(spec: dict) -> str | None:
+      missing = [key for key in _BULK_API_REQUIRED if not spec.get(key)]
+      if missing:
+        return f"missing required field(s): {', '.join(missing)}"
+      unsupported = sorted(spec.keys() - _BULK_API_FIELDS)
+      if unsupported:
+        return f"unsupported field(s): {', '.join(unsupported)}"
+      if spec['auth_type'] in _SECRET_AUTH_TYPES:
+        # One context credential can't belong to every API in a batch, and secrets must not
+        # be passed as tool arguments
+        return (
+          f"auth_type '{spec['auth_type']}' is not supported in bulk; "
+          'register this API with register_api'
+        )
+      return None
+
+    # Validate every entry up front (ignoring the batch-level warehouse_id/catalog/schema);
+    # failures are reported by position, since an entry may have no api_name
+    failed = []
+    valid = {}
+    for index, spec in enumerate(apis):
+      spec = {k: v for k, v in spec.items() if k not in _BULK_API_BATCH_FIELDS}
+      error = check(spec)
+      if error:
+        failed.append({'index': index, 'api_name': spec.get('api_name'), 'error': error})
+      else:
+        # The last definition of an api_name wins (as it would in the MERGE), so no two tasks
+        # DROP/CREATE the same connection concurrently
+        valid.pop(spec['api_name'], None)
+        valid[spec['api_name']] = (index, spec)
+
+    def prepare(spec: dict) -> dict:
+      return _register_api_impl(
+        warehouse_id=warehouse_id, catalog=catalog, schema=schema, write_row=False, **spec
+      )
+
+    # Each task runs in its own copy of this context so it authenticates as the caller
+    entries = list(valid.values())
+    with ThreadPoolExecutor(max_workers=min(8, len(entries) or 1)) as executor:
+      futures = [executor.submit(copy_context().run, prepare, spec) for _, spec in entries]
+      results = [future.result() for future in futures]
+
+    rows = [r['row'] for r in results if r.get('success')]
+    failed += [
+      {'index': index, 'api_name': spec['api_name'], 'error': r.get('error')}
+      for (index, spec), r in zip(entries, results) if not r.get('success')
+    ]
+    failed.sort(key=lambda entry: entry['index'])
+    if not rows:
+      return {'success': False, 'error': 'No APIs could be registered', 'failed': failed}
+
+    result = _merge_registry_rows(get_workspace_client(), rows, warehouse_id, catalog, schema)
+    if not result.get('success'):
+      return {
+        'success': False,
+        'error': f"Failed to write registry rows: {result.get('error')}",
+        'failed': failed,
+      }
+
+    return {
+      'success': not failed,
+      'registered': [
+        {
+          'api_id': row['api_id'],
+          'api_name': row['api_name'],
+          'connection_name': row['connection_name'],
+        }
+        for row in rows
+      ],
+      'failed': failed,
+      'message': f'✅ Registered {len(rows)} of {len(rows) + len(failed)} API(s)',
+    }
+
+  @mcp_server.tool
+  @_in_worker_thread
   def execute_api_call(
     api_name: str,
     path: str,
@@ -839,7 +1619,8 @@ VALUES (
     schema: str,
     http_method: str = 'GET',
     params: dict = None,
-    headers: dict = None
+    headers: dict = None,
+    response_fields: list[str] = None
   ) -> dict:
     """Execute an API call dynamically with any path.
     
@@ -857,6 +1638,9 @@ VALUES (
         http_method: HTTP method (default: GET)
         params: Query parameters as dict (e.g., {"type": "public", "per_page": "10"})
         headers: Additional HTTP headers as dict (optional)
+        response_fields: Top-level fields to keep from a JSON response body (optional).
+            Applied to the object, or to each object of an array. Use this for large
+            list endpoints when only a few fields are needed, e.g. ["id", "name"]
     
     Returns:
         Dictionary with API response
@@ -882,169 +1666,150 @@ VALUES (
         )
     """
     try:
-      import json
-      
       # Step 1: Look up API in registry
       table_name = f'`{catalog}`.`{schema}`.`api_http_registry`'
       lookup_query = f"""
-SELECT connection_name, auth_type, secret_scope, host, base_path, available_endpoints, example_calls
+SELECT {', '.join(_REGISTRY_LOOKUP_COLUMNS)}
 FROM {table_name}
-WHERE api_name = '{api_name}'
+WHERE api_name = :api_name
 LIMIT 1
 """
-      
-      result = _execute_sql_query(lookup_query, warehouse_id, catalog=None, schema=None, limit=1)
-      
+      lookup_params = _sql_params(api_name=api_name)
+      cache_key = _registry_key('api_name', catalog, schema, api_name)
+
+      # Step 2: Bind the http_request() arguments
+      # The connection already has auth configured, so we just call it.
+      # NOTE: Connection already has base_path configured, so we pass ONLY the dynamic path.
+      # params/headers are bound as JSON objects; NULL when empty (an empty map() is
+      # MAP<VOID,VOID>, which causes type errors)
+      params_json = _http_params_json(params)
+      headers_json = json.dumps(headers) if headers else None
+
+      def http_request_params(conn: str) -> list[StatementParameterListItem]:
+        return _sql_params(
+          conn=conn, method=http_method, path=path, params=params_json, headers=headers_json
+        )
+
+      call_sql = None
+      call_result = None
+      result = _get_cached_registry_lookup(cache_key, lookup_query, warehouse_id, lookup_params)
+      if result is None and http_method.upper() in _FUSED_CALL_METHODS:
+        # Cache miss: resolve the registry row AND make the call in a single warehouse round-trip.
+        # http_request() needs a constant connection name, so use the one register_api derives
+        # from api_name. The request only runs if the registry row exists.
+        expected_connection = f'{api_name.translate(_CONN_NAME_TRANS).lower()}_connection'
+        fused_sql = f"""
+SELECT reg.*, {_HTTP_REQUEST_SQL} as response
+FROM ({lookup_query}) reg
+"""
+        fused_result = _execute_sql_query(
+          fused_sql, warehouse_id, catalog=None, schema=None, limit=1,
+          parameters=lookup_params + http_request_params(expected_connection)
+        )
+        if fused_result.get('success'):
+          fused_rows = fused_result.get('data', {}).get('rows', [])
+          if fused_rows:
+            api_row = {k: v for k, v in fused_rows[0].items() if k != 'response'}
+            result = {
+              'success': True,
+              'data': {'columns': list(api_row), 'rows': [api_row]},
+              'row_count': 1,
+            }
+            _store_registry_lookup(cache_key, result)
+            if api_row['connection_name'] == expected_connection:
+              call_sql, call_result = fused_sql, fused_result
+          else:
+            result = fused_result  # No registry row; reported as not found below
+        else:
+          # The request may already have been sent, so it is only sent again if the row names
+          # a different connection than the one the fused statement called
+          result = _refresh_registry_lookup(cache_key, lookup_query, warehouse_id, lookup_params)
+          looked_up = result.get('data', {}).get('rows') if result.get('success') else None
+          if looked_up and looked_up[0]['connection_name'] == expected_connection:
+            call_sql, call_result = fused_sql, fused_result
+
+      # Otherwise (a non-GET call, or a registry row whose connection uses a different name),
+      # look the row up on its own and make the call separately
+      if result is None:
+        result = _refresh_registry_lookup(cache_key, lookup_query, warehouse_id, lookup_params)
+
       if not result.get('success'):
         return {'success': False, 'error': f"Failed to lookup API '{api_name}': {result.get('error')}"}
-      
+
       # _execute_sql_query returns data as {'columns': [...], 'rows': [...]}
       rows = result.get('data', {}).get('rows', [])
-      if not rows or len(rows) == 0:
+      if not rows:
         return {
           'success': False,
           'error': f"API '{api_name}' not found in registry. Please register it first using register_api().",
-          'hint': "Check available APIs with check_api_http_registry()"
+          'hint': 'Check available APIs with check_api_http_registry()'
         }
-      
+
       api_info = rows[0]
       connection_name = api_info['connection_name']
       auth_type = api_info['auth_type']
       secret_scope = api_info['secret_scope']
       base_path = api_info.get('base_path', '') or ''  # Get base_path from registry (for reference only)
-      
+
       # IMPORTANT: The HTTP connection already has base_path configured in its OPTIONS!
       # We should NOT prepend base_path to the dynamic path - the connection does that automatically.
       # Just use the dynamic path directly.
-      
-      print(f"📡 Calling API: {api_name}")
-      print(f"   Connection: {connection_name}")
-      print(f"   Base Path (in connection): {base_path}")
-      print(f"   Dynamic Path: {path}")
-      print(f"   Method: {http_method}")
-      print(f"   Auth: {auth_type}")
-      
-      # Step 2: Build SQL query using http_request() function
-      # The connection already has auth configured, so we just call it
-      
-      # Build params map - use NULL if empty (map() creates MAP<VOID,VOID> which causes type errors)
-      params_sql = "NULL"
-      if params:
-        param_pairs = []
-        for key, value in params.items():
-          if isinstance(value, str):
-            param_pairs.append(f"'{key}', '{value}'")
-          else:
-            param_pairs.append(f"'{key}', cast({value} as string)")
-        params_sql = f"map({', '.join(param_pairs)})"
-      
-      # Build headers map - use NULL if empty (map() creates MAP<VOID,VOID> which causes type errors)
-      headers_sql = "NULL"
-      if headers:
-        header_pairs = []
-        for key, value in headers.items():
-          header_pairs.append(f"'{key}', '{value}'")
-        headers_sql = f"map({', '.join(header_pairs)})"
-      
-      # Build the http_request SQL
-      # NOTE: Connection already has base_path configured, so we pass ONLY the dynamic path
-      call_sql = f"""
-SELECT http_request(
-  conn => '{connection_name}',
-  method => '{http_method}',
-  path => '{path}',
-  params => {params_sql},
-  headers => {headers_sql}
-) as response
+
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+          'Calling API: %s conn=%s base_path=%s path=%s method=%s auth=%s',
+          api_name, connection_name, base_path, path, http_method, auth_type
+        )
+
+      # Step 3: Execute the API call (unless it already ran together with the lookup)
+      if call_result is None:
+        call_sql = f"""
+SELECT {_HTTP_REQUEST_SQL} as response
 """
-      
-      print(f"=" * 80)
-      print(f"🔍 EXECUTING SQL QUERY:")
-      print(call_sql)
-      print(f"=" * 80)
-      
-      # Step 3: Execute the API call
-      call_result = _execute_sql_query(call_sql, warehouse_id, catalog=None, schema=None, limit=1)
-      
+
+        call_result = _execute_sql_query(
+          call_sql, warehouse_id, catalog=None, schema=None, limit=1,
+          parameters=http_request_params(connection_name)
+        )
+
       if not call_result.get('success'):
         error_msg = call_result.get('error')
-        print(f"❌ SQL execution failed: {error_msg}")
+        logger.error('API call SQL execution failed for %s: %s', api_name, error_msg)
         return {
           'success': False,
-          'error': f"API call failed: {error_msg}",
+          'error': f'API call failed: {error_msg}',
           'sql_query': call_sql,
           'path': path
         }
-      
+
       # _execute_sql_query returns data as {'columns': [...], 'rows': [...]}
       response_rows = call_result.get('data', {}).get('rows', [])
-      if not response_rows or len(response_rows) == 0:
-        print(f"❌ No response rows from API")
+      if not response_rows:
+        logger.warning('No response rows from API %s', api_name)
         return {
           'success': False,
-          'error': "No response from API",
+          'error': 'No response from API',
           'sql_query': call_sql,
           'path': path
         }
-      
+
       response_data = response_rows[0].get('response', '')
-      
+
       # Try to parse JSON response
       try:
         response_json = json.loads(response_data)
-        
+
         # Check if response indicates an error (4xx, 5xx, etc.)
         status_code = response_json.get('status_code', '200')
-        status_code_int = int(status_code) if isinstance(status_code, str) else status_code
-        
-        # Handle specific error codes
-        if status_code == '401' or status_code_int == 401:
-          print(f"❌ API returned 401 - Unauthorized: {path}")
-          return {
-            'success': False,
-            'error': f"401 Unauthorized - Authentication failed. Check your bearer token/API key in secret scope '{secret_scope}'",
-            'status_code': 401,
-            'api_name': api_name,
-            'base_path': base_path,
-            'path': path,
-            'method': http_method,
-            'auth_type': auth_type,
-            'secret_scope': secret_scope,
-            'sql_query': call_sql,
-            'response': response_json,
-            'hint': f"Verify secret exists: databricks secrets list --scope {secret_scope}"
-          }
-        elif status_code == '403' or status_code_int == 403:
-          print(f"❌ API returned 403 - Forbidden: {path}")
-          return {
-            'success': False,
-            'error': f"403 Forbidden - Access denied. Check your credentials and permissions.",
-            'status_code': 403,
-            'api_name': api_name,
-            'base_path': base_path,
-            'path': path,
-            'method': http_method,
-            'sql_query': call_sql,
-            'response': response_json
-          }
-        elif status_code == '404' or status_code_int == 404:
-          print(f"⚠️  API returned 404 - Path not found: {path}")
-          return {
-            'success': False,
-            'error': f"404 Not Found - The path '{path}' does not exist on this API",
-            'status_code': 404,
-            'api_name': api_name,
-            'base_path': base_path,
-            'path': path,
-            'method': http_method,
-            'sql_query': call_sql,
-            'response': response_json
-          }
-        elif status_code_int >= 400:
-          print(f"❌ API returned error status {status_code}: {path}")
-          return {
+        status_code_int = int(status_code)
+        if status_code_int >= 400:
+          logger.warning('API %s returned status %s: %s', api_name, status_code_int, path)
+          message = _HTTP_ERROR_MESSAGES.get(status_code_int, _HTTP_ERROR_DEFAULT)
+          error_result = {
             'success': False,
-            'error': f"HTTP {status_code} Error - API request failed",
+            'error': message.format(
+              status_code=status_code_int, path=path, secret_scope=secret_scope
+            ),
             'status_code': status_code_int,
             'api_name': api_name,
             'base_path': base_path,
@@ -1053,9 +1818,22 @@ SELECT http_request(
             'sql_query': call_sql,
             'response': response_json
           }
-        
+          if status_code_int == 401:
+            error_result['auth_type'] = auth_type
+            error_result['secret_scope'] = secret_scope
+            error_result['hint'] = (
+              f'Verify secret exists: databricks secrets list --scope {secret_scope}'
+            )
+          return error_result
+
         # Success response (2xx status codes)
-        print(f"✅ API call successful (status: {status_code})")
+        logger.debug('API call %s succeeded (status: %s)', api_name, status_code)
+        if response_fields and response_json.get('text'):
+          try:
+            body = json.loads(response_json['text'])
+            response_json['text'] = _project_fields(body, response_fields)
+          except json.JSONDecodeError:
+            pass  # Non-JSON body: nothing to project, return it as-is
         return {
           'success': True,
           'api_name': api_name,
@@ -1064,12 +1842,11 @@ SELECT http_request(
           'method': http_method,
           'status_code': status_code,
           'sql_query': call_sql,
-          'response': response_json,
-          'raw_response': response_data
+          'response': response_json
         }
-      except:
+      except (json.JSONDecodeError, ValueError, TypeError):
         # Return raw response if not JSON
-        print(f"⚠️  Response is not JSON, returning raw data")
+        logger.debug('Response from %s is not JSON, returning raw data', api_name)
         return {
           'success': True,
           'api_name': api_name,
@@ -1079,17 +1856,19 @@ SELECT http_request(
           'sql_query': call_sql,
           'response': response_data
         }
-    
+
     except Exception as e:
-      print(f'❌ Error executing API call: {str(e)}')
-      import traceback
-      traceback.print_exc()
+      # Tracebacks only at DEBUG: formatting one per failure is costly when a backend is down
+      logger.error(
+        'Error executing API call %s: %s', api_name, e, exc_info=logger.isEnabledFor(logging.DEBUG)
+      )
       return {'success': False, 'error': str(e)}
 
   # Note: Old connection management tools deprecated in favor of new register_api
   # which handles connection creation automatically
 
   @mcp_server.tool
+  @_in_worker_thread
   def list_http_connections() -> dict:
     """List all Unity Catalog HTTP connections the user has access to.
 
@@ -1099,21 +1878,31 @@ SELECT http_request(
     try:
       w = get_workspace_client()
 
-      connections = []
-      for conn in w.connections.list():
-        if conn.connection_type == ConnectionType.HTTP:
-          # Get detailed info
-          conn_detail = w.connections.get(conn.name)
-          connections.append({
-            'name': conn_detail.name,
-            'connection_type': conn_detail.connection_type.value,
-            'comment': conn_detail.comment,
-            'owner': conn_detail.owner,
-            'created_at': conn_detail.created_at,
-            'updated_at': conn_detail.updated_at,
-            'host': conn_detail.options.get('host') if conn_detail.options else None,
-            'base_path': conn_detail.options.get('base_path') if conn_detail.options else None,
-          })
+      # list() returns full ConnectionInfo objects (options, owner, timestamps), so details
+      # are only fetched - concurrently - for entries that come back without options.
+      http_conns = [
+        c for c in w.connections.list(max_results=0) if c.connection_type == ConnectionType.HTTP
+      ]
+      missing = [i for i, c in enumerate(http_conns) if c.options is None]
+      if missing:
+        with ThreadPoolExecutor(max_workers=min(16, len(missing))) as executor:
+          details = executor.map(lambda i: w.connections.get(http_conns[i].name), missing)
+          for i, detail in zip(missing, details):
+            http_conns[i] = detail
+
+      connections = [
+        {
+          'name': conn.name,
+          'connection_type': conn.connection_type.value,
+          'comment': conn.comment,
+          'owner': conn.owner,
+          'created_at': conn.created_at,
+          'updated_at': conn.updated_at,
+          'host': conn.options.get('host') if conn.options else None,
+          'base_path': conn.options.get('base_path') if conn.options else None,
+        }
+        for conn in http_conns
+      ]
 
       return {
         'success': True,
@@ -1123,11 +1912,14 @@ SELECT http_request(
       }
 
     except Exception as e:
-      print(f'❌ Error listing HTTP connections: {str(e)}')
+      logger.error(
+        'Error listing HTTP connections: %s', e, exc_info=logger.isEnabledFor(logging.DEBUG)
+      )
       return {'success': False, 'error': f'Error: {str(e)}', 'connections': [], 'count': 0}
 
   @mcp_server.tool
-  def test_http_connection(connection_name: str, path: str = "/", http_method: str = "GET") -> dict:
+  @_in_worker_thread
+  def test_http_connection(connection_name: str, path: str = '/', http_method: str = 'GET') -> dict:
     """Test a Unity Catalog HTTP connection by making a sample request.
 
     Args:
@@ -1141,23 +1933,14 @@ SELECT http_request(
     try:
       w = get_workspace_client()
 
-      # Map string method to enum
-      method_map = {
-        'GET': ExternalFunctionRequestHttpMethod.GET,
-        'POST': ExternalFunctionRequestHttpMethod.POST,
-        'PUT': ExternalFunctionRequestHttpMethod.PUT,
-        'DELETE': ExternalFunctionRequestHttpMethod.DELETE,
-        'PATCH': ExternalFunctionRequestHttpMethod.PATCH,
-      }
-
-      method_enum = method_map.get(http_method.upper())
+      method_enum = _HTTP_METHOD_MAP.get(http_method.upper())
       if not method_enum:
         return {
           'success': False,
-          'error': f'Invalid HTTP method: {http_method}. Must be one of: {list(method_map.keys())}',
+          'error': f'Invalid HTTP method: {http_method}. Must be one of: {list(_HTTP_METHOD_MAP)}',
         }
 
-      print(f'🧪 Testing HTTP connection: {connection_name}')
+      logger.debug('Testing HTTP connection: %s', connection_name)
 
       # Make test request
       response = w.serving_endpoints.http_request(
@@ -1175,7 +1958,10 @@ SELECT http_request(
       }
 
     except Exception as e:
-      print(f'❌ Error testing HTTP connection: {str(e)}')
+      logger.error(
+        'Error testing HTTP connection %s: %s', connection_name, e,
+        exc_info=logger.isEnabledFor(logging.DEBUG)
+      )
       return {
         'success': False,
         'is_healthy': False,
@@ -1194,7 +1980,10 @@ SELECT http_request(
         'message': f'✅ Successfully deleted HTTP connection: {connection_name}',
       }
     except Exception as e:
-      print(f'❌ Error deleting HTTP connection: {str(e)}')
+      logger.error(
+        'Error deleting HTTP connection %s: %s', connection_name, e,
+        exc_info=logger.isEnabledFor(logging.DEBUG)
+      )
       return {'success': False, 'error': f'Error: {str(e)}'}
 
   @mcp_server.tool
@@ -1218,7 +2007,8 @@ SELECT http_request(
     warehouse_id: str,
     catalog: str,
     schema: str,
-    limit: int = 100
+    limit: int = 100,
+    include_endpoint_paths: bool = False
   ) -> dict:
     """Check the API HTTP Registry to see all registered APIs.
 
@@ -1230,6 +2020,8 @@ SELECT http_request(
         catalog: Catalog name (required)
         schema: Schema name (required)
         limit: Maximum number of rows to return (default: 100)
+        include_endpoint_paths: Also add an '_endpoint_paths' list of just the paths
+            from available_endpoints for each API (default: False)
 
     Returns:
         Dictionary with API registry results including:
@@ -1248,7 +2040,7 @@ SELECT http_request(
     table_name = f'{catalog}.{schema}.api_http_registry'
     query = f'SELECT * FROM {table_name}'
 
-    print(f'📊 Querying API HTTP registry table: {table_name}')
+    logger.debug('Querying API HTTP registry table: %s', table_name)
 
     result = _execute_sql_query(query, warehouse_id, catalog=None, schema=None, limit=limit)
 
@@ -1261,37 +2053,47 @@ SELECT http_request(
         'full_table_name': table_name,
         'description': 'API Registry using Unity Catalog HTTP Connections for secure credential management',
       }
-      
-      # Parse and highlight available_endpoints for each API
+
+      # Parse available_endpoints / example_calls in place (JSON strings in the table)
       rows = result.get('data', {}).get('rows', [])
       for row in rows:
-        # Parse available_endpoints JSON if it exists
-        if row.get('available_endpoints'):
-          try:
-            import json
-            endpoints = json.loads(row['available_endpoints'])
-            row['available_endpoints_parsed'] = endpoints
-            row['_endpoint_paths'] = [ep.get('path') for ep in endpoints]
-          except:
-            pass
-        
-        # Parse example_calls JSON if it exists
-        if row.get('example_calls'):
-          try:
-            import json
-            examples = json.loads(row['example_calls'])
-            row['example_calls_parsed'] = examples
-          except:
-            pass
-      
+        for field in ('available_endpoints', 'example_calls'):
+          if row.get(field):
+            try:
+              row[field] = json.loads(row[field])
+            except (json.JSONDecodeError, ValueError, TypeError):
+              pass  # Leave malformed JSON as the raw string
+        if include_endpoint_paths and isinstance(row.get('available_endpoints'), list):
+          row['_endpoint_paths'] = [
+            ep.get('path') for ep in row['available_endpoints'] if isinstance(ep, dict)
+          ]
+
       # Add a summary for the LLM
-      result['_IMPORTANT_READ_THIS'] = (
-        "⚠️ BEFORE calling execute_api_call, CHECK the 'available_endpoints_parsed' field for each API. "
-        "This tells you which paths are documented to exist. DO NOT guess or assume paths - use only what's listed!"
-      )
+      result['_IMPORTANT_READ_THIS'] = _IMPORTANT_READ_THIS
 
     return result
 
+  @mcp_server.tool
+  def refresh_api_cache(catalog: str = None, schema: str = None) -> dict:
+    """Clear cached API registry lookups so the next calls re-read the registry table.
+
+    Registry rows are cached for a few minutes. Use this after editing the
+    api_http_registry table outside of the registration tools.
+
+    Args:
+        catalog: Only clear entries for this catalog (optional, default: all)
+        schema: Only clear entries for this schema (optional, default: all)
+
+    Returns:
+        Dictionary with the number of cache entries cleared
+    """
+    cleared = _clear_registry_cache(catalog, schema)
+    return {
+      'success': True,
+      'cleared': cleared,
+      'message': f'Cleared {cleared} cached registry lookup(s)',
+    }
+
   # Private helper for registering APIs
   def _register_api_with_connection_impl(
     api_name: str,
@@ -1330,7 +2132,7 @@ SELECT http_request(
       username = 'unknown'
       if user_token:
         try:
-          config = Config(host=os.environ.get('DATABRICKS_HOST'), token=user_token, auth_type='pat')
+          config = Config(host=_databricks_host(), token=user_token, auth_type='pat')
           w = WorkspaceClient(config=config)
           current_user = w.current_user.me()
           username = current_user.user_name if current_user.user_name else 'unknown'
@@ -1338,11 +2140,10 @@ SELECT http_request(
           username = 'unknown'
 
       # Generate unique API ID
-      api_id = f'api-{str(uuid.uuid4())[:8]}'
+      api_id = f'api-{uuid.uuid4().hex[:8]}'
 
-      # Get current timestamp
-      created_at = datetime.now(timezone.utc).isoformat()
-      modified_date = created_at
+      # Get current timestamp (used for both created_at and modified_date)
+      now = datetime.now(timezone.utc).isoformat()
 
       # Initial status
       status = 'pending'
@@ -1350,17 +2151,12 @@ SELECT http_request(
 
       # Optionally validate the connection
       if validate:
-        print(f'🔍 Validating UC HTTP connection: {connection_name}')
+        logger.debug('Validating UC HTTP connection: %s', connection_name)
         w = get_workspace_client()
         try:
-          method_map = {
-            'GET': ExternalFunctionRequestHttpMethod.GET,
-            'POST': ExternalFunctionRequestHttpMethod.POST,
-            'PUT': ExternalFunctionRequestHttpMethod.PUT,
-            'DELETE': ExternalFunctionRequestHttpMethod.DELETE,
-            'PATCH': ExternalFunctionRequestHttpMethod.PATCH,
-          }
-          method_enum = method_map.get(http_method.upper(), ExternalFunctionRequestHttpMethod.GET)
+          method_enum = _HTTP_METHOD_MAP.get(
+            http_method.upper(), ExternalFunctionRequestHttpMethod.GET
+          )
 
           response = w.serving_endpoints.http_request(
             conn=connection_name,
@@ -1368,46 +2164,39 @@ SELECT http_request(
             path=api_path,
           )
           status = 'valid'
-          validation_message = f'✅ Connection validated successfully'
+          validation_message = '✅ Connection validated successfully'
         except Exception as e:
           status = 'pending'
           validation_message = f'⚠️  Validation error: {str(e)}'
 
-      # Escape single quotes in strings for SQL
-      def escape_sql_string(s):
-        return s.replace("'", "''") if s else ''
-
       # Build fully-qualified table name
       table_name = f'{catalog}.{schema}.api_http_registry'
 
       # Build INSERT query
-      insert_query = f"""
-INSERT INTO {table_name}
-(api_id, api_name, description, connection_name, api_path,
- http_method, request_headers, documentation_url, parameters,
- status, validation_message, user_who_requested, created_at, modified_date)
-VALUES (
-  '{api_id}',
-  '{escape_sql_string(api_name)}',
-  '{escape_sql_string(description)}',
-  '{escape_sql_string(connection_name)}',
-  '{escape_sql_string(api_path)}',
-  '{escape_sql_string(http_method.upper())}',
-  '{escape_sql_string(request_headers)}',
-  {f"'{escape_sql_string(documentation_url)}'" if documentation_url else 'NULL'},
-  {f"'{escape_sql_string(parameters)}'" if parameters else 'NULL'},
-  '{escape_sql_string(status)}',
-  '{escape_sql_string(validation_message)}',
-  '{escape_sql_string(username)}',
-  '{created_at}',
-  '{modified_date}'
-)
-"""
+      insert_query = _TMPL_CONNECTION_REGISTRY_INSERT.substitute(table_name=table_name)
+      insert_params = _sql_params(
+        api_id=api_id,
+        api_name=api_name,
+        description=description or '',
+        connection_name=connection_name or '',
+        api_path=api_path or '',
+        http_method=http_method.upper(),
+        request_headers=request_headers or '',
+        documentation_url=documentation_url or None,
+        parameters=parameters or None,
+        status=status,
+        validation_message=validation_message,
+        user_who_requested=username,
+        now=now,
+      )
 
       # Execute the INSERT
-      result = _execute_sql_query(insert_query, warehouse_id, catalog=None, schema=None, limit=1)
+      result = _execute_sql_query(
+        insert_query, warehouse_id, catalog=None, schema=None, limit=1, parameters=insert_params
+      )
 
       if result.get('success'):
+        _invalidate_registry_cache(catalog, schema, api_name)
         return {
           'success': True,
           'api_id': api_id,
@@ -1418,7 +2207,7 @@ VALUES (
           'validation_message': validation_message,
           'message': f'✅ Successfully registered API "{api_name}" using connection "{connection_name}"',
           'next_steps': [
-            f'View registered APIs: check_api_http_registry()',
+            'View registered APIs: check_api_http_registry()',
             f'Call the API: call_registered_api(api_id="{api_id}")',
           ],
         }
@@ -1429,7 +2218,9 @@ VALUES (
         }
 
     except Exception as e:
-      print(f'❌ Error registering API: {str(e)}')
+      logger.error(
+        'Error registering API %s: %s', api_name, e, exc_info=logger.isEnabledFor(logging.DEBUG)
+      )
       return {'success': False, 'error': f'Registration error: {str(e)}'}
 
   @mcp_server.tool
@@ -1483,6 +2274,7 @@ VALUES (
     }
 
   @mcp_server.tool
+  @_in_worker_thread
   def call_registered_api(
     api_id: str,
     warehouse_id: str,
@@ -1519,10 +2311,13 @@ VALUES (
       query = f"""
         SELECT api_name, connection_name, api_path, http_method, request_headers
         FROM {table_name}
-        WHERE api_id = '{api_id}'
+        WHERE api_id = :api_id
       """
 
-      result = _execute_sql_query(query, warehouse_id, catalog=None, schema=None, limit=1)
+      result = _cached_registry_lookup(
+        _registry_key('api_id', catalog, schema, api_id), query, warehouse_id,
+        _sql_params(api_id=api_id)
+      )
 
       if not result.get('success') or not result.get('data', {}).get('rows'):
         return {
@@ -1544,56 +2339,50 @@ VALUES (
         api_path_with_params = f'{api_path_with_params}{separator}{query_params}'
 
       # Use full connection name (catalog.schema.connection_name)
-      full_connection_name = f"{catalog}.{schema}.{connection_name}"
+      full_connection_name = f'{catalog}.{schema}.{connection_name}'
 
-      print(f'🌐 Calling API via SQL http_request()')
-      print(f'   Connection: {full_connection_name}')
-      print(f'   Path: {api_path_with_params}')
-      print(f'   Method: {http_method}')
+      if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+          'Calling API via SQL http_request(): conn=%s path=%s method=%s',
+          full_connection_name, api_path_with_params, http_method
+        )
 
-      # Build SQL query using http_request() function
-      import json
-      headers_map = "map('Accept', 'application/json')"
+      # Build SQL query using http_request(); headers are bound as one JSON object
+      headers_dict = {'Accept': 'application/json'}
       if additional_headers:
         try:
-          headers_dict = json.loads(additional_headers) if isinstance(additional_headers, str) else additional_headers
-          header_pairs = [f"'{k}', '{v}'" for k, v in headers_dict.items()]
-          headers_map = f"map({', '.join(header_pairs)})"
-        except:
-          print(f'⚠️  Could not parse additional_headers, using default')
-
-      sql = f"""SELECT http_request(
-  conn => '{full_connection_name}',
-  method => '{http_method}',
-  path => '{api_path_with_params}',
-  headers => {headers_map}
-) as response"""
+          headers_dict = (
+            json.loads(additional_headers)
+            if isinstance(additional_headers, str)
+            else additional_headers
+          )
+        except (json.JSONDecodeError, TypeError, ValueError):
+          logger.warning('Could not parse additional_headers, using default')
 
       # Execute the SQL
       w = get_workspace_client()
-      sql_result = w.statement_execution.execute_statement(
+      sql_result = _run_statement(
+        w,
         warehouse_id=warehouse_id,
-        statement=sql,
-        wait_timeout="30s"
+        statement=f'SELECT {_HTTP_REQUEST_SQL} as response',
+        parameters=_sql_params(
+          conn=full_connection_name,
+          method=http_method,
+          path=api_path_with_params,
+          params=None,
+          headers=json.dumps({k: str(v) for k, v in headers_dict.items()}),
+        )
       )
 
       if not sql_result.status or not sql_result.status.state:
         return {'success': False, 'error': 'No status from SQL execution'}
 
       state = sql_result.status.state.value
-      if state != "SUCCEEDED":
-        error_msg = sql_result.status.error.message if sql_result.status.error else "Unknown error"
+      if state != 'SUCCEEDED':
+        error_msg = sql_result.status.error.message if sql_result.status.error else 'Unknown error'
         return {'success': False, 'error': f'SQL http_request failed: {error_msg}', 'state': state}
 
-      # Parse response from SQL result
-      response_data = None
-      if sql_result.result and sql_result.result.data_array:
-        if len(sql_result.result.data_array) > 0 and len(sql_result.result.data_array[0]) > 0:
-          response_str = sql_result.result.data_array[0][0]
-          try:
-            response_data = json.loads(response_str)
-          except:
-            response_data = response_str
+      response_data = _parse_http_response(sql_result)
 
       return {
         'success': True,
@@ -1605,73 +2394,26 @@ VALUES (
       }
 
     except Exception as e:
-      print(f'❌ Error calling registered API: {str(e)}')
+      logger.error('Error calling registered API %s: %s', api_id, e)
       return {'success': False, 'error': f'Error: {str(e)}'}
 
-  @mcp_server.tool
-  def call_parameterized_api(
+  # Private helper shared by call_parameterized_api and call_parameterized_apis_batch
+  def _call_parameterized_api_impl(
     api_id: str,
+    api_row: dict,
     warehouse_id: str,
     catalog: str,
     schema: str,
-    params: str | dict = None
+    params: str | dict = None,
+    validate_docs: bool = False
   ) -> dict:
-    """Call a parameterized API with dynamic parameters and documentation validation.
-
-    **NEW: This tool now fetches API documentation to validate path structure and parameters.**
-
-    This retrieves the API from the registry, fetches its documentation (if available),
-    validates the path structure against documentation, and makes the API request.
-
-    The response includes:
-    - API response data
-    - Path structure used (base_path + api_path)
-    - Documentation validation results (if documentation_url is available)
-    - Warnings if stored path doesn't match documentation
-
-    Args:
-        api_id: ID of the registered API to call
-        warehouse_id: SQL warehouse ID to query registry
-        catalog: Catalog name (required)
-        schema: Schema name (required)
-        params: Parameter values as JSON string or dict, e.g.: '{"series_id": "GDPC1", "frequency": "q"}' or {"series_id": "GDPC1"}
+    """Validate parameters against an API's registry row and call it via SQL http_request().
 
-    Returns:
-        Dictionary with:
-        - success: Boolean indicating call success
-        - response: API response data
-        - path_used: Structure showing base_path, api_path, and full_path
-        - documentation_validation: (if docs available) Validation results and warnings
-        - parameters_used: The parameters that were sent
+    api_row holds the registry columns in _API_PARAMS_COLUMNS; the other arguments and the
+    result are as for call_parameterized_api.
     """
-    if not catalog or not schema:
-      return {
-        'success': False,
-        'error': 'catalog and schema parameters are required',
-      }
-
     try:
-      import json
-
-      # Get API metadata from registry (including documentation_url for validation)
-      table_name = f'{catalog}.{schema}.api_http_registry'
-      query = f"""
-        SELECT api_name, connection_name, host, base_path, api_path, http_method,
-               parameters, auth_type, secret_scope, documentation_url
-        FROM {table_name}
-        WHERE api_id = '{api_id}'
-      """
-
-      result = _execute_sql_query(query, warehouse_id, catalog=None, schema=None, limit=1)
-
-      if not result.get('success') or not result.get('data', {}).get('rows'):
-        return {
-          'success': False,
-          'error': f'API with id "{api_id}" not found in registry',
-        }
-
       # Get API details
-      api_row = result['data']['rows'][0]
       api_name = api_row.get('api_name')
       connection_name = api_row.get('connection_name')
       host = api_row.get('host', '')
@@ -1683,30 +2425,37 @@ VALUES (
       secret_scope = api_row.get('secret_scope')
       documentation_url = api_row.get('documentation_url')
 
-      # CRITICAL: Fetch documentation to validate path structure
+      # Documentation validation is opt-in: it costs a network round-trip that the call itself
+      # doesn't need
       doc_insights = None
-      if documentation_url:
-        print(f'📚 Fetching documentation to validate path structure: {documentation_url}')
+      if validate_docs and documentation_url:
+        logger.debug('Fetching documentation to validate path structure: %s', documentation_url)
         doc_result = _fetch_api_documentation_impl(documentation_url=documentation_url)
 
         if doc_result.get('success'):
           doc_insights = {
             'found_urls': doc_result.get('found_urls', []),
             'found_paths': doc_result.get('found_paths', []),
-            'found_params': doc_result.get('found_params', []),
-            'content_preview': doc_result.get('content_preview', '')[:500]
+            'found_params': doc_result.get('found_params', [])
           }
-          print(f'✅ Documentation fetched: Found {len(doc_insights["found_paths"])} endpoint paths')
+          logger.debug(
+            'Documentation fetched: found %d endpoint paths', len(doc_insights['found_paths'])
+          )
 
           # Warn if stored api_path doesn't appear in documentation
-          full_expected_path = f"{base_path}{api_path}" if base_path else api_path
-          path_matches = [p for p in doc_insights['found_paths'] if api_path in p or p in full_expected_path]
+          full_expected_path = f'{base_path}{api_path}' if base_path else api_path
+          has_match = any(
+            api_path in p or p in full_expected_path for p in doc_insights['found_paths']
+          )
 
-          if not path_matches and doc_insights['found_paths']:
-            print(f'⚠️  WARNING: Stored api_path "{api_path}" not found in documentation!')
-            print(f'   Documentation suggests these paths: {doc_insights["found_paths"][:3]}')
+          if not has_match and doc_insights['found_paths']:
+            logger.warning(
+              'Stored api_path %r not found in documentation; it suggests %s',
+              api_path,
+              doc_insights['found_paths'][:3],
+            )
         else:
-          print(f'⚠️  Could not fetch documentation: {doc_result.get("error")}')
+          logger.warning('Could not fetch documentation: %s', doc_result.get('error'))
 
       # Parse provided parameters - accept both dict and JSON string
       provided_params = {}
@@ -1737,13 +2486,11 @@ VALUES (
           query_params_defs = param_config.get('query_params', [])
           param_defs = {p['name']: p for p in query_params_defs}
         except json.JSONDecodeError:
-          print(f'⚠️  Warning: Could not parse parameter definitions')
+          logger.warning('Could not parse parameter definitions for API %s', api_id)
 
       # Validate required parameters
-      missing_required = []
-      for param_name, param_def in param_defs.items():
-        if param_def.get('required') and param_name not in provided_params:
-          missing_required.append(param_name)
+      required_names = {name for name, param_def in param_defs.items() if param_def.get('required')}
+      missing_required = sorted(required_names - provided_params.keys())
 
       if missing_required:
         return {
@@ -1754,16 +2501,26 @@ VALUES (
 
       # Build SQL http_request() call with proper auth handling
       # Use full connection name (catalog.schema.connection_name)
-      full_connection_name = f"{catalog}.{schema}.{connection_name}"
-
-      print(f'🌐 Calling parameterized API via SQL http_request()')
-      print(f'   Connection: {full_connection_name}')
-      print(f'   Path: {api_path}')
-      print(f'   Auth Type: {auth_type}')
-      print(f'   Parameters: {provided_params}')
+      full_connection_name = f'{catalog}.{schema}.{connection_name}'
+
+      logger.debug(
+        'Calling parameterized API via SQL http_request(): '
+        'connection=%s path=%s auth_type=%s params=%s',
+        full_connection_name,
+        api_path,
+        auth_type,
+        list(provided_params),
+      )
 
-      # Build params map for SQL
-      param_entries = []
+      # Every value is bound as a parameter, so the statement text is one of two constants
+      params_json = _http_params_json(provided_params)
+      call_params = _sql_params(
+        conn=full_connection_name,
+        method=http_method,
+        path=api_path,
+        headers=_ACCEPT_JSON_HEADERS,
+      )
+      sql = f'SELECT {_HTTP_REQUEST_SQL} as response'
 
       # For api_key auth, add secret reference to params
       if auth_type == 'api_key':
@@ -1771,51 +2528,28 @@ VALUES (
           return {'success': False, 'error': 'API key auth configured but no secret scope found'}
         # Use the secret scope from database (stored during registration)
         secret_key = api_name  # Simple: just the API name
-        param_entries.append(f"'api_key', secret('{secret_scope}', '{secret_key}')")
-
-      # Add user-provided parameters
-      for key, value in provided_params.items():
-        # Escape single quotes in values
-        escaped_value = str(value).replace("'", "''")
-        param_entries.append(f"'{key}', '{escaped_value}'")
-
-      params_str = ",\n    ".join(param_entries) if param_entries else ""
-      params_map = f"map(\n    {params_str}\n  )" if params_str else "NULL"
-
-      # Build the SQL query
-      sql = f"""SELECT http_request(
-  conn => '{full_connection_name}',
-  method => '{http_method}',
-  path => '{api_path}',
-  params => {params_map},
-  headers => map('Accept', 'application/json')
-) as response"""
+        params_json = params_json or '{}'  # map_concat() with a NULL map is NULL
+        call_params += _sql_params(secret_scope=secret_scope, secret_key=secret_key)
+        sql = f'SELECT {_HTTP_REQUEST_APIKEY_SQL} as response'
 
       # Execute the SQL
       w = get_workspace_client()
-      sql_result = w.statement_execution.execute_statement(
+      sql_result = _run_statement(
+        w,
         warehouse_id=warehouse_id,
         statement=sql,
-        wait_timeout="30s"
+        parameters=call_params + _sql_params(params=params_json)
       )
 
       if not sql_result.status or not sql_result.status.state:
         return {'success': False, 'error': 'No status from SQL execution'}
 
       state = sql_result.status.state.value
-      if state != "SUCCEEDED":
-        error_msg = sql_result.status.error.message if sql_result.status.error else "Unknown error"
+      if state != 'SUCCEEDED':
+        error_msg = sql_result.status.error.message if sql_result.status.error else 'Unknown error'
         return {'success': False, 'error': f'SQL http_request failed: {error_msg}', 'state': state}
 
-      # Parse response from SQL result
-      response_data = None
-      if sql_result.result and sql_result.result.data_array:
-        if len(sql_result.result.data_array) > 0 and len(sql_result.result.data_array[0]) > 0:
-          response_str = sql_result.result.data_array[0][0]
-          try:
-            response_data = json.loads(response_str)
-          except:
-            response_data = response_str
+      response_data = _parse_http_response(sql_result)
 
       result_data = {
         'success': True,
@@ -1826,7 +2560,7 @@ VALUES (
         'path_used': {
           'base_path': base_path,
           'api_path': api_path,
-          'full_path': f"{base_path}{api_path}" if base_path else api_path
+          'full_path': f'{base_path}{api_path}' if base_path else api_path
         },
         'parameters_used': provided_params,
         'response': response_data,
@@ -1840,8 +2574,9 @@ VALUES (
           'found_paths_in_docs': doc_insights['found_paths'],
           'found_params_in_docs': doc_insights['found_params'],
           'warning': (
-            f'⚠️  Stored api_path may not match documentation. Check found_paths_in_docs.'
-            if doc_insights['found_paths'] and api_path not in str(doc_insights['found_paths'])
+            '⚠️  Stored api_path may not match documentation. Check found_paths_in_docs.'
+            if doc_insights['found_paths']
+            and not any(api_path in p for p in doc_insights['found_paths'])
             else None
           )
         }
@@ -1849,9 +2584,170 @@ VALUES (
       return result_data
 
     except Exception as e:
-      print(f'❌ Error calling parameterized API: {str(e)}')
+      logger.error(
+        'Error calling parameterized API %s: %s', api_id, e,
+        exc_info=logger.isEnabledFor(logging.DEBUG)
+      )
+      return {'success': False, 'error': f'Error: {str(e)}'}
+
+  @mcp_server.tool
+  @_in_worker_thread
+  def call_parameterized_api(
+    api_id: str,
+    warehouse_id: str,
+    catalog: str,
+    schema: str,
+    params: str | dict = None,
+    validate_docs: bool = False
+  ) -> dict:
+    """Call a parameterized API with dynamic parameters and optional documentation validation.
+
+    This retrieves the API from the registry and makes the API request. With
+    validate_docs=True it also fetches the API's documentation (if available)
+    and validates the stored path structure against it.
+
+    The response includes:
+    - API response data
+    - Path structure used (base_path + api_path)
+    - Documentation validation results (if validate_docs and documentation_url is available)
+    - Warnings if stored path doesn't match documentation
+
+    Args:
+        api_id: ID of the registered API to call
+        warehouse_id: SQL warehouse ID to query registry
+        catalog: Catalog name (required)
+        schema: Schema name (required)
+        params: Parameter values as JSON string or dict, e.g.: '{"series_id": "GDPC1", "frequency": "q"}' or {"series_id": "GDPC1"}
+        validate_docs: Fetch the API's documentation and check the stored path against it
+            (default: False, which skips the extra network round-trip)
+
+    Returns:
+        Dictionary with:
+        - success: Boolean indicating call success
+        - response: API response data
+        - path_used: Structure showing base_path, api_path, and full_path
+        - documentation_validation: (if validate_docs and docs available) Validation results
+          and warnings
+        - parameters_used: The parameters that were sent
+    """
+    if not catalog or not schema:
+      return {
+        'success': False,
+        'error': 'catalog and schema parameters are required',
+      }
+
+    try:
+      # Get API metadata from registry (including documentation_url for validation)
+      query = _API_PARAMS_LOOKUP_SQL.substitute(table_name=f'{catalog}.{schema}.api_http_registry')
+
+      result = _cached_registry_lookup(
+        _registry_key('api_params', catalog, schema, api_id), query, warehouse_id,
+        _sql_params(api_id=api_id)
+      )
+
+      if not result.get('success') or not result.get('data', {}).get('rows'):
+        return {
+          'success': False,
+          'error': f'API with id "{api_id}" not found in registry',
+        }
+
+      return _call_parameterized_api_impl(
+        api_id, result['data']['rows'][0], warehouse_id, catalog, schema, params, validate_docs
+      )
+
+    except Exception as e:
+      logger.error(
+        'Error calling parameterized API: %s', e, exc_info=logger.isEnabledFor(logging.DEBUG)
+      )
       return {'success': False, 'error': f'Error: {str(e)}'}
 
+  @mcp_server.tool
+  @_in_worker_thread
+  def call_parameterized_apis_batch(
+    api_calls: list[dict],
+    warehouse_id: str,
+    catalog: str,
+    schema: str
+  ) -> dict:
+    """Call several registered APIs, reading all of their registry rows in one statement.
+
+    The registry rows for every api_id are fetched with a single SELECT (rows that are
+    already cached are reused), then the http_request() calls run concurrently. Use this
+    instead of repeated call_parameterized_api calls when a workflow needs several APIs.
+
+    Args:
+        api_calls: List of dicts, each with the call_parameterized_api arguments for one call
+            (api_id, and optionally params and validate_docs)
+        warehouse_id: SQL warehouse ID to query registry
+        catalog: Catalog name (required)
+        schema: Schema name (required)
+
+    Returns:
+        Dictionary with:
+        - success: True if every call succeeded
+        - results: One call_parameterized_api result per entry of api_calls, in the same order
+        - succeeded / failed: Number of calls that succeeded and failed
+    """
+    if not catalog or not schema:
+      return {'success': False, 'error': 'catalog and schema parameters are required'}
+
+    table_name = f'{catalog}.{schema}.api_http_registry'
+    lookup_sql = _API_PARAMS_LOOKUP_SQL.substitute(table_name=table_name)
+    api_ids = list(dict.fromkeys(call.get('api_id') for call in api_calls if call.get('api_id')))
+
+    # Serve rows the per-API lookup cache already holds, then read all the others at once
+    api_rows = {}
+    for api_id in api_ids:
+      cached = _get_cached_registry_lookup(
+        _registry_key('api_params', catalog, schema, api_id), lookup_sql, warehouse_id,
+        _sql_params(api_id=api_id)
+      )
+      if cached is not None:
+        api_rows[api_id] = cached['data']['rows'][0]
+
+    missing = [api_id for api_id in api_ids if api_id not in api_rows]
+    if missing:
+      result = _execute_sql_query(
+        _API_PARAMS_BATCH_SQL.substitute(table_name=table_name),
+        warehouse_id, catalog=None, schema=None, limit=len(missing),
+        parameters=_sql_params(api_ids=json.dumps(missing)),
+      )
+      if not result.get('success'):
+        return {'success': False, 'error': f"Failed to read registry rows: {result.get('error')}"}
+      for row in result['data'].get('rows', []):
+        api_id = row.pop('api_id')
+        api_rows[api_id] = row
+        _store_registry_lookup(
+          _registry_key('api_params', catalog, schema, api_id),
+          {
+            'success': True,
+            'data': {'columns': list(_API_PARAMS_COLUMNS), 'rows': [row]},
+            'row_count': 1,
+          },
+        )
+
+    def call_api(call: dict) -> dict:
+      api_id = call.get('api_id')
+      if api_id not in api_rows:
+        return {'success': False, 'error': f'API with id "{api_id}" not found in registry'}
+      return _call_parameterized_api_impl(
+        api_id, api_rows[api_id], warehouse_id, catalog, schema,
+        call.get('params'), call.get('validate_docs', False),
+      )
+
+    # Each call runs in its own copy of this context so it authenticates as the caller
+    with ThreadPoolExecutor(max_workers=min(8, len(api_calls) or 1)) as executor:
+      futures = [executor.submit(copy_context().run, call_api, call) for call in api_calls]
+      results = [future.result() for future in futures]
+
+    failed = sum(1 for r in results if not r.get('success'))
+    return {
+      'success': not failed,
+      'results': results,
+      'succeeded': len(results) - failed,
+      'failed': failed,
+    }
+
   # ========================================
   # API Discovery & Smart Registration Tools
   # ========================================
@@ -1861,55 +2757,65 @@ VALUES (
     """Internal implementation for fetching API documentation.
 
     This is a private helper that can be called from other tools without MCP tool conflicts.
+    Successful results are cached per URL for an hour.
     """
-    try:
-      import requests
-      import re
+    cached = _get_cached_documentation(documentation_url)
+    if cached is not None:
+      return cached
 
-      print(f'📚 Fetching API documentation from: {documentation_url}')
-      response = requests.get(documentation_url, timeout=timeout)
-
-      if response.status_code != 200:
-        return {
-          'success': False,
-          'error': f'Failed to fetch documentation (status {response.status_code})'
-        }
+    try:
+      logger.debug('Fetching API documentation from: %s', documentation_url)
+      with _HTTP_SESSION.get(documentation_url, timeout=timeout, stream=True) as response:
+        if response.status_code != 200:
+          return {
+            'success': False,
+            'error': f'Failed to fetch documentation (status {response.status_code})'
+          }
 
-      content = response.text
+        body = response.raw.read(_DOC_MAX_BYTES, decode_content=True)
+        # One more byte tells whether the page was truncated, without slicing a copy of body
+        truncated = bool(response.raw.read(1, decode_content=True))
+      content = body.decode(response.encoding or 'utf-8', errors='replace')
+      del body  # Only the decoded text is scanned below
+      content_length = len(content)
+      content_preview = content[:1000]
 
       # Extract common API patterns from documentation
       # Look for URL patterns (http/https URLs)
-      url_pattern = r'https?://[^\s<>"\']+(?:/[^\s<>"\']*)?'
-      found_urls = re.findall(url_pattern, content)
+      found_urls = _first_unique_matches(_URL_RE, content)
 
       # Look for API endpoint paths
-      path_pattern = r'/api/[^\s<>"\']+|/v\d+/[^\s<>"\']+|/[a-z_]+/[a-z_]+'
-      found_paths = re.findall(path_pattern, content)
+      found_paths = _first_unique_matches(_PATH_RE, content)
 
       # Look for parameter names (common API parameter patterns)
-      param_patterns = ['apikey', 'api_key', 'token', 'function', 'symbol', 'query']
-      found_params = []
-      for param in param_patterns:
-        if param in content.lower():
-          found_params.append(param)
+      seen_params = set()
+      for match in _PARAM_RE.finditer(content):
+        seen_params.add(match.group(0).lower())
+        if len(seen_params) == len(_DOC_PARAM_NAMES):
+          break
+      found_params = [param for param in _DOC_PARAM_NAMES if param in seen_params]
 
-      # Extract code examples (often in <code>, <pre>, or ``` blocks)
-      code_pattern = r'<code>(.*?)</code>|<pre>(.*?)</pre>|```(.*?)```'
-      code_examples = re.findall(code_pattern, content, re.DOTALL)
+      # Count code examples (often in <code>, <pre>, or ``` blocks) without materializing them
+      code_examples_count = sum(1 for _ in _CODE_RE.finditer(content))
 
-      return {
+      result = {
         'success': True,
         'url': documentation_url,
-        'content_preview': content[:1000],
-        'found_urls': list(set(found_urls))[:10],
-        'found_paths': list(set(found_paths))[:10],
+        'content_preview': content_preview,
+        'found_urls': found_urls,
+        'found_paths': found_paths,
         'found_params': found_params,
-        'code_examples_count': len(code_examples),
-        'content_length': len(content)
+        'code_examples_count': code_examples_count,
+        'content_length': content_length,
+        'content_truncated': truncated
       }
+      _store_documentation(documentation_url, result)
+      return result
 
     except Exception as e:
-      print(f'❌ Error fetching documentation: {str(e)}')
+      logger.error(
+        'Error fetching documentation: %s', e, exc_info=logger.isEnabledFor(logging.DEBUG)
+      )
       return {'success': False, 'error': f'Error: {str(e)}'}
 
   @mcp_server.tool
@@ -1956,8 +2862,7 @@ VALUES (
         - next_steps: Recommendations for registration
     """
     try:
-      import requests
-      from urllib.parse import urlparse, parse_qs
+      from urllib.parse import parse_qs, urlparse
 
       # Parse the URL
       parsed_url = urlparse(endpoint_url)
@@ -1965,7 +2870,7 @@ VALUES (
       base_url = f'{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}'
       host = parsed_url.netloc
 
-      print(f'🔍 Discovering API endpoint: {endpoint_url}')
+      logger.debug('Discovering API endpoint: %s', endpoint_url)
 
       # First attempt: Call without API key
       requires_auth = False
@@ -1974,22 +2879,23 @@ VALUES (
       sample_data = None
 
       try:
-        response_no_auth = requests.get(endpoint_url, timeout=timeout)
+        response_no_auth = _HTTP_SESSION.get(endpoint_url, timeout=timeout)
         initial_status = response_no_auth.status_code
+        response_text = _response_text(response_no_auth)
 
         if initial_status == 200:
           is_accessible = True
           requires_auth = False
           try:
-            sample_data = response_no_auth.json()
-          except:
-            sample_data = response_no_auth.text[:500]
+            sample_data = json.loads(response_text)
+          except (json.JSONDecodeError, ValueError):
+            sample_data = response_text[:500]
         elif initial_status in [401, 403]:
           requires_auth = True
           auth_method = 'bearer_token'
 
         # Check response content for auth indicators
-        response_lower = str(response_no_auth.text).lower()
+        response_lower = response_text.lower()
         if any(keyword in response_lower for keyword in ['api key', 'apikey', 'api_key', 'unauthorized']):
           requires_auth = True
 
@@ -2002,40 +2908,49 @@ VALUES (
 
       # If API key provided, try with authentication
       if api_key and requires_auth:
-        print(f'🔑 Testing with provided API key...')
+        logger.debug('Testing with provided API key')
 
-        # Try common auth patterns
-        auth_attempts = [
-          {'params': {**query_params, 'apikey': [api_key]}},
-          {'params': {**query_params, 'api_key': [api_key]}},
-          {'headers': {'Authorization': f'Bearer {api_key}'}},
-        ]
+        # Try common auth patterns; parse_qs gives lists, so flatten the query to scalars once
+        base_query = {k: v[0] if isinstance(v, list) else v for k, v in query_params.items()}
+        param_attempts = [{**base_query, 'apikey': api_key}, {**base_query, 'api_key': api_key}]
 
-        for attempt in auth_attempts:
-          try:
-            params = {k: v[0] if isinstance(v, list) else v for k, v in attempt.get('params', {}).items()}
-            auth_response = requests.get(
-              base_url,
-              params=params,
-              headers=attempt.get('headers', {}),
-              timeout=timeout
-            )
+        def probe(params: dict = None, headers: dict = None):
+          return _HTTP_SESSION.get(base_url, params=params, headers=headers, timeout=timeout)
 
-            if auth_response.status_code == 200:
-              is_accessible = True
-              try:
-                sample_data = auth_response.json()
-              except:
-                sample_data = auth_response.text[:500]
-
-              # Determine auth method
-              if 'Authorization' in attempt.get('headers', {}):
-                auth_method = 'bearer_token'
-              else:
-                auth_method = 'api_key_param'
+        # Both query parameter forms mean the same auth method, so send them concurrently and
+        # take whichever returns 200 first; a slow or hung probe doesn't hold up the other
+        auth_response = None
+        executor = ThreadPoolExecutor(max_workers=len(param_attempts))
+        try:
+          futures = [executor.submit(probe, params=params) for params in param_attempts]
+          for future in as_completed(futures):
+            try:
+              response = future.result()
+            except Exception:
+              continue
+            if response.status_code == 200:
+              auth_response, auth_method = response, 'api_key_param'
               break
-          except:
-            continue
+        finally:
+          # Don't wait on the other probe once one has succeeded
+          executor.shutdown(wait=False, cancel_futures=True)
+
+        # Only send the key as a Bearer header if no query parameter form worked
+        if auth_response is None:
+          try:
+            response = probe(headers={'Authorization': f'Bearer {api_key}'})
+            if response.status_code == 200:
+              auth_response, auth_method = response, 'bearer_token'
+          except Exception as e:
+            logger.debug('Bearer token probe failed: %s', e)
+
+        if auth_response is not None:
+          is_accessible = True
+          auth_text = _response_text(auth_response)
+          try:
+            sample_data = json.loads(auth_text)
+          except (json.JSONDecodeError, ValueError):
+            sample_data = auth_text[:500]
 
       # Build recommendations
       next_steps = []
@@ -2043,7 +2958,8 @@ VALUES (
         if requires_auth and api_key:
           next_steps = [
             '✅ API is accessible with provided credentials',
-            f'Ready to register! Use smart_register_with_connection() to create UC connection and register API',
+            'Ready to register! Use smart_register_with_connection() to create UC connection '
+            'and register API',
           ]
         elif not requires_auth:
           next_steps = [
@@ -2073,7 +2989,7 @@ VALUES (
       }
 
     except Exception as e:
-      print(f'❌ Error discovering API: {str(e)}')
+      logger.error('Error discovering API: %s', e, exc_info=logger.isEnabledFor(logging.DEBUG))
       return {
         'success': False,
         'error': f'Discovery error: {str(e)}',
@@ -2124,10 +3040,9 @@ VALUES (
         Dictionary with documentation parsing results and guidance for using register_api()
     """
     try:
-      from urllib.parse import urlparse, parse_qs, urlencode
+      from urllib.parse import parse_qs, urlparse
 
-      print(f'🚀 Smart registration starting for: {api_name}')
-      print(f'📚 Documentation-first workflow: Fetching API documentation...')
+      logger.debug('Smart registration starting for %s: fetching API documentation', api_name)
 
       # Step 1: MANDATORY - Fetch and parse documentation FIRST
       doc_result = _fetch_api_documentation_impl(documentation_url=documentation_url)
@@ -2152,7 +3067,7 @@ VALUES (
         if param_name in query_params:
           api_key_from_url = query_params[param_name][0]
           del query_params[param_name]
-          print(f'🔑 Extracted API key from URL parameter: {param_name}')
+          logger.debug('Extracted API key from URL parameter: %s', param_name)
           break
 
       # Use extracted key if no explicit api_key was provided
@@ -2161,9 +3076,12 @@ VALUES (
       # Determine auth type
       auth_type = 'api_key' if secret_value else 'none'
 
-      print(f'📍 Endpoint URL provided: {endpoint_url}')
-      print(f'📄 Documentation fetched successfully')
-      print(f'🔍 Found {len(doc_result.get("found_urls", []))} URLs and {len(doc_result.get("found_paths", []))} paths in documentation')
+      logger.debug(
+        'Documentation fetched for %s: found %d URLs and %d paths',
+        endpoint_url,
+        len(doc_result.get('found_urls', [])),
+        len(doc_result.get('found_paths', [])),
+      )
 
       # Step 3: Return documentation insights and guidance for LLM
       return {
@@ -2210,7 +3128,9 @@ VALUES (
       }
 
     except Exception as e:
-      print(f'❌ Error in smart registration: {str(e)}')
+      logger.error(
+        'Error in smart registration: %s', e, exc_info=logger.isEnabledFor(logging.DEBUG)
+      )
       return {
         'success': False,
         'error': f'Smart registration error: {str(e)}',